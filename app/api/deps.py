@@ -1,54 +1,78 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
-from jose import JWTError
 
 from app.core.database import get_db
 from app.models.user import User
-from app.core.security import decode_token
+from app.core.security import get_token_claims
 from app.core.roles import UserRole
+from app.core.principal_cache import principal_cache
+from app.schemas.auth import Principal
 
 from typing import Iterable
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
 async def get_current_user(
+    request: Request,
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db),
-) -> User:
-    try:
-        payload = decode_token(token)
-        user_id = payload.get("sub")
-        token_type = payload.get("type")
-        
-        if token_type != "access":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
-            )
+) -> Principal:
+    payload = get_token_claims(request)
     
-    except JWTError:
+    if payload is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token",
         )
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
+    if payload.get("type") != "access":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token type",
+        )
+    
+    user_id = payload.get("sub")
+    
+    async def load_principal() -> Principal | None:
+        result = await db.execute(select(User).where(User.id == user_id))
+        user = result.scalar_one_or_none()
+        return Principal.model_validate(user) if user else None
     
-    if not user or user.is_deleted or not user.is_active:
+    principal = await principal_cache.get_or_load(user_id, load_principal)
+    
+    if not principal or principal.is_deleted or not principal.is_active:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
     
-    return user
+    return principal
 
 def require_roles(roles: Iterable[UserRole]):
-    async def role_checker(user: User = Depends(get_current_user)):
+    async def role_checker(user: Principal = Depends(get_current_user)):
         if user.role not in roles:
             raise HTTPException(status_code=403,detail="Forbidden")
         return user
     
     return role_checker
+
+
+def parse_include(allowed: Iterable[str]):
+    allowed = set(allowed)
+    
+    def include_parser(include: str | None = None) -> set[str]:
+        if not include:
+            return set()
+        
+        values = {value.strip() for value in include.split(",") if value.strip()}
+        unknown = values - allowed
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown include: {', '.join(sorted(unknown))}",
+            )
+        return values
+    
+    return include_parser
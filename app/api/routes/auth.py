@@ -10,8 +10,8 @@ from app.core.rate_limiter import RateLimiter
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
-login_limiter = RateLimiter(limit=10, window_seconds=60)
-register_limiter = RateLimiter(limit=5, window_seconds=60)
+login_limiter = RateLimiter(limit=10, window_seconds=60, name="login")
+register_limiter = RateLimiter(limit=5, window_seconds=60, name="register")
 
 @router.post(
     "/register",
@@ -19,7 +19,7 @@ register_limiter = RateLimiter(limit=5, window_seconds=60)
     dependencies=[Depends(register_limiter)],
 )
 async def register(data: UserCreate, db: AsyncSession = Depends(get_db)):
-    user = await AuthService.register(data.email, data.password, db)
+    user = await AuthService.register(data.email, data.password, db, data.display_name)
     return user
 
 @router.post(
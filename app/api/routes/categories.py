@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db, replica_may_be_stale
 from app.api.deps import require_roles
 from app.core.roles import UserRole
 from app.repositories.category import CategoryRepository
@@ -11,7 +11,14 @@ from app.schemas.category import (
     CategoryUpdate,
     CategoryRead,
 )
-from app.schemas.pagination import Page
+from app.schemas.pagination import Page, TotalMode
+from app.core.response_cache import response_cache, CATEGORY_LIST_TAG
+from app.core.conditional import (
+    make_etag,
+    validator_headers,
+    is_not_modified,
+    not_modified,
+)
 
 router = APIRouter(prefix="/categories", tags=["categories"])
 
@@ -32,12 +39,73 @@ async def create_category(
     dependencies=[Depends(require_roles([UserRole.ADMIN]))],
 )
 async def get_categories(
+    request: Request,
     limit: int = Query(10, le=100),
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    total_mode: TotalMode = Query(TotalMode.EXACT, alias="total"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    headers = {}
+    version = await response_cache.versions(CATEGORY_LIST_TAG)
+    if version is not None:
+        tag_version, last_modified = version
+        headers = validator_headers(
+            make_etag(limit, offset, total_mode, tag_version),
+            last_modified,
+        )
+        if is_not_modified(request, headers):
+            return not_modified(headers)
+    
+    total, items, has_more = await CategoryRepository.get_all(
+        db,
+        limit,
+        offset,
+        total_mode,
+    )
+    page = Page[CategoryRead](
+        total=total,
+        limit=limit,
+        offset=offset,
+        items=[CategoryRead.model_validate(item) for item in items],
+        total_mode=total_mode,
+        has_more=has_more,
+    )
+    
+    if version is not None and replica_may_be_stale(request, last_modified):
+        headers = {}
+    
+    return Response(
+        content=page.model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
+
+@router.get(
+    "/{category_id}",
+    response_model=CategoryRead,
+    dependencies=[Depends(require_roles([UserRole.ADMIN]))],
+)
+async def get_category(
+    category_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    total, items = await CategoryRepository.get_all(db, limit, offset)
-    return Page(total=total, limit=limit, offset=offset, items=items)
+    category = await CategoryRepository.get_by_id(category_id, db)
+    if not category:
+        raise HTTPException(404)
+    
+    headers = validator_headers(
+        make_etag(category.id, category.updated_at),
+        category.updated_at,
+    )
+    if is_not_modified(request, headers):
+        return not_modified(headers)
+    
+    return Response(
+        content=CategoryRead.model_validate(category).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
+    )
 
 @router.patch(
     "/{category_id}",
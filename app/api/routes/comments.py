@@ -1,24 +1,52 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_roles
+from app.core.database import get_db, get_read_db, replica_may_be_stale
+from app.api.deps import get_current_user, require_roles, parse_include
 from app.core.roles import UserRole
-from app.repositories.comment import CommentRepository
+from app.repositories.comment import CommentRepository, MAX_THREAD_DEPTH
+from app.repositories.post import PostRepository
 from app.schemas.comment import (
     CommentCreate,
     CommentUpdate,
     CommentRead,
+    CommentExpandedRead,
+    CommentBulkCreate,
+    CommentBulkResult,
 )
-from app.schemas.pagination import Page
-from app.models.user import User
+from app.schemas.pagination import Page, TotalMode
+from app.schemas.auth import Principal
 from app.core.rate_limiter import RateLimiter
+from app.core.response_cache import response_cache, AUTHOR_TAG, post_tag
+from app.services.export import ExportService, ExportFormat, MEDIA_TYPES
+from app.core.conditional import (
+    make_etag,
+    validator_headers,
+    is_not_modified,
+    not_modified,
+)
 
-create_comment_limiter = RateLimiter(limit=20, window_seconds=60)
+# Single and bulk creates draw on one per-user item budget, so a batch can
+# never exceed what the single-create endpoint would allow in a minute.
+create_comment_limiter = RateLimiter(limit=200, window_seconds=60, name="create_comment")
 
 router = APIRouter(prefix="/comments", tags=["comments"])
 
+def reply_error(data: CommentCreate, parents: dict) -> str | None:
+    if data.parent_id is None:
+        return None
+    
+    parent = parents.get(data.parent_id)
+    if parent is None or parent.post_id != data.post_id:
+        return "Parent comment not found"
+    
+    if parent.depth + 1 > MAX_THREAD_DEPTH:
+        return "Thread is too deep"
+    
+    return None
+
 @router.post(
     "/",
     response_model=CommentRead,
@@ -30,35 +58,249 @@ router = APIRouter(prefix="/comments", tags=["comments"])
 async def create_comment(
     data: CommentCreate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
+    parents = {}
+    if data.parent_id:
+        parents = await CommentRepository.get_parents({data.parent_id}, db)
+    
+    error = reply_error(data, parents)
+    if error:
+        raise HTTPException(status_code=400, detail=error)
+    
     comment_data = data.model_dump()
     comment_data["author_id"] = user.id
+    comment_data.update(
+        CommentRepository.thread_position(parents.get(data.parent_id))
+    )
     
     return await CommentRepository.create(comment_data, db)
 
+@router.post(
+    "/bulk",
+    response_model=list[CommentBulkResult],
+    dependencies=[Depends(require_roles([UserRole.USER, UserRole.ADMIN]))],
+)
+async def create_comments_bulk(
+    data: CommentBulkCreate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+):
+    limit_result = await create_comment_limiter.check(
+        request,
+        cost=len(data.items),
+    )
+    create_comment_limiter.apply_headers(response, limit_result)
+    
+    post_ids = await PostRepository.get_existing_ids(
+        {item.post_id for item in data.items},
+        db,
+    )
+    parents = await CommentRepository.get_parents(
+        {item.parent_id for item in data.items if item.parent_id},
+        db,
+    )
+    
+    results: list[CommentBulkResult | None] = [None] * len(data.items)
+    rows = []
+    indexes = []
+    
+    for index, item in enumerate(data.items):
+        if item.post_id not in post_ids:
+            results[index] = CommentBulkResult(
+                index=index,
+                status="error",
+                error="Post not found",
+            )
+            continue
+        
+        error = reply_error(item, parents)
+        if error:
+            results[index] = CommentBulkResult(
+                index=index,
+                status="error",
+                error=error,
+            )
+            continue
+        
+        comment_data = item.model_dump()
+        comment_data["author_id"] = user.id
+        comment_data.update(
+            CommentRepository.thread_position(parents.get(item.parent_id))
+        )
+        rows.append(comment_data)
+        indexes.append(index)
+    
+    if rows:
+        comments = await CommentRepository.bulk_create(rows, db)
+        for index, comment in zip(indexes, comments):
+            results[index] = CommentBulkResult(
+                index=index,
+                status="created",
+                item=CommentRead.model_validate(comment),
+            )
+    
+    return results
+
 @router.get(
     "/post/{post_id}",
-    response_model=Page[CommentRead],
+    response_model=Page[CommentExpandedRead],
 )
 async def get_comments_for_post(
+    request: Request,
     post_id: UUID,
     limit: int = Query(10, le=100),
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    total_mode: TotalMode = Query(TotalMode.EXACT, alias="total"),
+    include: set[str] = Depends(parse_include(["author"])),
+    db: AsyncSession = Depends(get_read_db),
 ):
-    total, items = await CommentRepository.get_by_post(
+    tags = [post_tag(post_id)]
+    if "author" in include:
+        tags.append(AUTHOR_TAG)
+    version = await response_cache.versions(*tags)
+    
+    cache_key = None
+    headers = {}
+    if version is not None:
+        tag_version, last_modified = version
+        cache_key = response_cache.make_key(
+            "comments",
+            post_id=post_id,
+            limit=limit,
+            offset=offset,
+            total=total_mode,
+            include=",".join(sorted(include)) or None,
+            version=tag_version,
+        )
+        headers = validator_headers(make_etag(cache_key), last_modified)
+        if is_not_modified(request, headers):
+            return not_modified(headers)
+        
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            body, _ = cached
+            return Response(content=body, media_type="application/json", headers=headers)
+    
+    total, items, has_more = await CommentRepository.get_by_post(
         post_id,
         db,
         limit,
         offset,
+        total_mode,
+        include,
     )
     
-    return Page(
+    page = Page[CommentExpandedRead](
         total=total,
         limit=limit,
         offset=offset,
+        items=[CommentExpandedRead.model_validate(item) for item in items],
+        total_mode=total_mode,
+        has_more=has_more,
+    )
+    
+    body = page.model_dump_json()
+    if cache_key is not None:
+        # A lagging replica may predate the write that bumped the version.
+        if replica_may_be_stale(request, last_modified):
+            headers = {}
+        else:
+            await response_cache.set(cache_key, body, tags, headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get(
+    "/post/{post_id}/threads",
+    response_model=Page[CommentRead],
+)
+async def get_threads_for_post(
+    post_id: UUID,
+    limit: int = Query(10, le=100),
+    offset: int = 0,
+    max_depth: int = Query(5, ge=0, le=MAX_THREAD_DEPTH),
+    db: AsyncSession = Depends(get_read_db),
+):
+    items, has_more = await CommentRepository.get_threads(
+        post_id,
+        db,
+        limit,
+        offset,
+        max_depth,
+    )
+    
+    return Page(
+        total=None,
+        limit=limit,
+        offset=offset,
         items=items,
+        total_mode=TotalMode.NONE,
+        has_more=has_more,
+    )
+
+@router.get(
+    "/{comment_id}/thread",
+    response_model=list[CommentRead],
+)
+async def get_comment_thread(
+    comment_id: UUID,
+    max_depth: int = Query(5, ge=0, le=MAX_THREAD_DEPTH),
+    db: AsyncSession = Depends(get_read_db),
+):
+    items = await CommentRepository.get_subtree(comment_id, db, max_depth)
+    
+    if not items:
+        raise HTTPException(404)
+    
+    return items
+
+@router.get(
+    "/export",
+    dependencies=[Depends(require_roles([UserRole.ADMIN]))],
+)
+async def export_comments(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    post_id: UUID | None = None,
+):
+    return StreamingResponse(
+        ExportService.stream(
+            request,
+            CommentRepository.export_query(post_id),
+            CommentRead,
+            export_format,
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers=ExportService.headers("comments", export_format),
+    )
+
+@router.get(
+    "/{comment_id}",
+    response_model=CommentRead,
+)
+async def get_comment(
+    comment_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    comment = await CommentRepository.get_by_id(comment_id, db)
+    
+    if not comment:
+        raise HTTPException(404)
+    
+    headers = validator_headers(
+        make_etag(comment.id, comment.updated_at),
+        comment.updated_at,
+    )
+    if is_not_modified(request, headers):
+        return not_modified(headers)
+    
+    return Response(
+        content=CommentRead.model_validate(comment).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
     )
 
 @router.patch(
@@ -69,7 +311,7 @@ async def update_comment(
     comment_id: UUID,
     data: CommentUpdate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     comment = await CommentRepository.get_by_id(comment_id, db)
     
@@ -91,7 +333,7 @@ async def update_comment(
 async def delete_comment(
     comment_id: UUID,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     comment = await CommentRepository.get_by_id(comment_id, db)
     
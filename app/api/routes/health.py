@@ -1,43 +1,58 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
-from app.core.database import get_db
-from app.core.redis import redis_client
+from fastapi import APIRouter, Response, status
+from app.core.database import get_pool_stats, replica_router
+from app.core.redis import redis_breaker
+from app.core.response_cache import response_cache
+from app.services.health import health_service
 
 router = APIRouter(prefix="/health", tags=["health"])
 
+@router.get("/live")
+async def health_live():
+    return {"status": "ok"}
+
+@router.get("/ready")
+async def health_ready(response: Response):
+    result = await health_service.check()
+    
+    if result["status"] != "ok":
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    
+    return {
+        **result,
+        "database_pool": get_pool_stats(),
+        "redis_breaker": redis_breaker.status(),
+    }
+
 @router.get("/db")
-async def health_db(db: AsyncSession = Depends(get_db)):
-    try:
-        await db.execute(text("SELECT 1"))
-        return {"database": "ok"}
-    except Exception:
-        return {"database": "error"}
+async def health_db():
+    result = await health_service.check()
+    return {"database": result["checks"]["database"]["status"]}
 
 @router.get("/redis")
 async def health_redis():
-    try:
-        await redis_client.ping()
-        return {"redis": "ok"}
-    except Exception:
-        return {"redis": "error"}
+    result = await health_service.check()
+    return {"redis": result["checks"]["redis"]["status"]}
 
 @router.get("/full")
-async def health_full(db: AsyncSession = Depends(get_db)):
-    db_status = "ok"
-    redis_status = "ok"
-    
-    try:
-        await db.execute(text("SELECT 1"))
-    except Exception:
-        db_status = "error"
-    
-    try:
-        await redis_client.ping()
-    except Exception:
-        redis_status = "error"
+async def health_full():
+    result = await health_service.check()
     
     return {
-        "database": db_status,
-        "redis": redis_status,
-    }
\ No newline at end of file
+        "database": result["checks"]["database"]["status"],
+        "redis": result["checks"]["redis"]["status"],
+        "latency_ms": {
+            name: check["latency_ms"] for name, check in result["checks"].items()
+        },
+        "redis_breaker": redis_breaker.status(),
+    }
+
+@router.get("/cache")
+async def health_cache():
+    return {"response_cache": response_cache.stats()}
+
+@router.get("/pool")
+async def health_pool():
+    return {
+        "database_pool": get_pool_stats(),
+        "replicas": replica_router.status(),
+    }
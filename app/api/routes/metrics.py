@@ -0,0 +1,66 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core.metrics import registry
+from app.core.database import engine, get_engine_pool_stats, replica_router
+from app.core.security import password_hasher, verified_token_cache
+from app.core.response_cache import response_cache
+
+router = APIRouter(tags=["metrics"])
+
+@registry.collector
+def pool_metrics():
+    engines = {"primary": engine}
+    engines.update({
+        f"replica-{index}": replica
+        for index, replica in enumerate(replica_router.engines)
+    })
+    
+    metrics = []
+    for pool, pool_engine in engines.items():
+        stats = get_engine_pool_stats(pool_engine)
+        labels = {"pool": pool}
+        metrics.extend([
+            ("db_pool_size", "gauge", "Configured pool size.", stats["size"], labels),
+            ("db_pool_checked_out", "gauge", "Connections currently checked out.", stats["checked_out"], labels),
+            ("db_pool_overflow", "gauge", "Overflow connections currently open.", stats["overflow"], labels),
+            ("db_pool_saturation", "gauge", "Checked out connections over pool capacity.", stats["saturation"], labels),
+            ("db_pool_checkouts_total", "counter", "Connections checked out of the pool.", stats["checkouts"], labels),
+            ("db_pool_timeouts_total", "counter", "Checkouts that timed out waiting for a connection.", stats["timeouts"], labels),
+            ("db_pool_wait_seconds_total", "counter", "Time spent waiting for pool checkouts.", stats["wait_seconds_total"], labels),
+            ("db_pool_wait_seconds_max", "gauge", "Longest single wait for a pool checkout.", stats["wait_seconds_max"], labels),
+        ])
+    return metrics
+
+@registry.collector
+def password_hasher_metrics():
+    stats = password_hasher.stats()
+    return [
+        ("password_hash_in_flight", "gauge", "Password hash jobs running.", stats["in_flight"]),
+        ("password_hash_queued", "gauge", "Password hash jobs waiting for a worker.", stats["queued"]),
+        ("password_hash_rejected_total", "counter", "Password hash jobs rejected with 503.", stats["rejected"]),
+    ]
+
+@registry.collector
+def token_cache_metrics():
+    stats = verified_token_cache.stats()
+    return [
+        ("token_cache_size", "gauge", "Verified tokens held in worker memory.", stats["size"]),
+        ("token_cache_hits_total", "counter", "Requests that skipped JWT verification.", stats["hits"]),
+        ("token_cache_misses_total", "counter", "Requests that verified a JWT.", stats["misses"]),
+    ]
+
+@registry.collector
+def response_cache_metrics():
+    stats = response_cache.stats()
+    return [
+        ("response_cache_hits_total", "counter", "Response cache hits.", stats["hits"]),
+        ("response_cache_misses_total", "counter", "Response cache misses.", stats["misses"]),
+        ("response_cache_evictions_total", "counter", "Response cache keys evicted by tag invalidation.", stats["evictions"]),
+    ]
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    return PlainTextResponse(
+        registry.render(),
+        media_type="text/plain; version=0.0.4",
+    )
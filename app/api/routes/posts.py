@@ -1,17 +1,43 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_db
-from app.api.deps import get_current_user, require_roles
+from app.core.database import get_db, get_read_db, replica_may_be_stale
+from app.api.deps import get_current_user, require_roles, parse_include
 from app.core.roles import UserRole
 from app.repositories.post import PostRepository
-from app.schemas.post import PostCreate, PostUpdate, PostRead
-from app.schemas.pagination import Page
-from app.models.user import User
+from app.repositories.category import CategoryRepository
+from app.schemas.post import (
+    PostCreate,
+    PostUpdate,
+    PostRead,
+    PostExpandedRead,
+    PostSort,
+    PostBulkCreate,
+    PostBulkResult,
+)
+from app.schemas.pagination import Page, TotalMode
+from app.schemas.auth import Principal
 from app.core.rate_limiter import RateLimiter
+from app.core.pagination import decode_cursor
+from app.core.conditional import (
+    make_etag,
+    validator_headers,
+    is_not_modified,
+    not_modified,
+)
+from app.services.export import ExportService, ExportFormat, MEDIA_TYPES
+from app.core.response_cache import (
+    response_cache,
+    POST_LIST_TAG,
+    AUTHOR_TAG,
+    category_tag,
+)
 
-create_post_limiter = RateLimiter(limit=10, window_seconds=60)
+# Single and bulk creates draw on one per-user item budget, so a batch can
+# never exceed what the single-create endpoint would allow in a minute.
+create_post_limiter = RateLimiter(limit=100, window_seconds=60, name="create_post")
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
@@ -26,32 +52,205 @@ router = APIRouter(prefix="/posts", tags=["posts"])
 async def create_post(
     data: PostCreate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     post_data = data.model_dump()
     post_data["author_id"] = user.id
     
     return await PostRepository.create(post_data, db)
 
+@router.post(
+    "/bulk",
+    response_model=list[PostBulkResult],
+    dependencies=[Depends(require_roles([UserRole.USER, UserRole.ADMIN]))],
+)
+async def create_posts_bulk(
+    data: PostBulkCreate,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_db),
+    user: Principal = Depends(get_current_user),
+):
+    limit_result = await create_post_limiter.check(request, cost=len(data.items))
+    create_post_limiter.apply_headers(response, limit_result)
+    
+    category_ids = await CategoryRepository.get_existing_ids(
+        {item.category_id for item in data.items},
+        db,
+    )
+    
+    results: list[PostBulkResult | None] = [None] * len(data.items)
+    rows = []
+    indexes = []
+    
+    for index, item in enumerate(data.items):
+        if item.category_id not in category_ids:
+            results[index] = PostBulkResult(
+                index=index,
+                status="error",
+                error="Category not found",
+            )
+            continue
+        
+        post_data = item.model_dump()
+        post_data["author_id"] = user.id
+        rows.append(post_data)
+        indexes.append(index)
+    
+    if rows:
+        posts = await PostRepository.bulk_create(rows, db)
+        for index, post in zip(indexes, posts):
+            results[index] = PostBulkResult(
+                index=index,
+                status="created",
+                item=PostRead.model_validate(post),
+            )
+    
+    return results
+
 @router.get(
     "/",
-    response_model=Page[PostRead],
+    response_model=Page[PostExpandedRead],
 )
 async def get_posts(
+    request: Request,
     limit: int = Query(10, le=100),
     offset: int = 0,
+    cursor: str | None = None,
     search: str | None = None,
     category_id: UUID | None = None,
-    db: AsyncSession = Depends(get_db),
+    total_mode: TotalMode = Query(TotalMode.EXACT, alias="total"),
+    include: set[str] = Depends(parse_include(["author", "category"])),
+    sort: PostSort = PostSort.NEWEST,
+    db: AsyncSession = Depends(get_read_db),
 ):
-    total, items = await PostRepository.get_all(
+    if cursor and search:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is not supported with search",
+        )
+    
+    if cursor and sort != PostSort.NEWEST:
+        raise HTTPException(
+            status_code=400,
+            detail="Cursor pagination is only supported with sort=newest",
+        )
+    
+    decoded_cursor = None
+    if cursor:
+        try:
+            decoded_cursor = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    
+    search = search.strip() or None if search else None
+    tags = [category_tag(category_id)] if category_id else [POST_LIST_TAG]
+    if "author" in include:
+        tags.append(AUTHOR_TAG)
+    version = await response_cache.versions(*tags)
+    
+    cache_key = None
+    headers = {}
+    if version is not None:
+        tag_version, last_modified = version
+        cache_key = response_cache.make_key(
+            "posts",
+            limit=limit,
+            offset=0 if cursor else offset,
+            cursor=cursor,
+            search=search,
+            category_id=category_id,
+            total=total_mode,
+            include=",".join(sorted(include)) or None,
+            sort=sort,
+            version=tag_version,
+        )
+        headers = validator_headers(make_etag(cache_key), last_modified)
+        if is_not_modified(request, headers):
+            return not_modified(headers)
+        
+        cached = await response_cache.get(cache_key)
+        if cached is not None:
+            body, _ = cached
+            return Response(content=body, media_type="application/json", headers=headers)
+    
+    total, items, has_more, next_cursor = await PostRepository.get_all(
         db,
         limit,
         offset,
         search,
         category_id,
+        decoded_cursor,
+        total_mode,
+        include,
+        sort,
+    )
+    page = Page[PostExpandedRead](
+        total=total,
+        limit=limit,
+        offset=0 if cursor else offset,
+        items=[PostExpandedRead.model_validate(item) for item in items],
+        next_cursor=next_cursor,
+        total_mode=total_mode,
+        has_more=has_more,
+    )
+    
+    body = page.model_dump_json()
+    if cache_key is not None:
+        # A lagging replica may predate the write that bumped the version.
+        if replica_may_be_stale(request, last_modified):
+            headers = {}
+        else:
+            await response_cache.set(cache_key, body, tags, headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+@router.get(
+    "/export",
+    dependencies=[Depends(require_roles([UserRole.ADMIN]))],
+)
+async def export_posts(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    category_id: UUID | None = None,
+):
+    return StreamingResponse(
+        ExportService.stream(
+            request,
+            PostRepository.export_query(category_id),
+            PostRead,
+            export_format,
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers=ExportService.headers("posts", export_format),
+    )
+
+@router.get(
+    "/{post_id}",
+    response_model=PostRead,
+)
+async def get_post(
+    post_id: UUID,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db),
+):
+    post = await PostRepository.get_by_id(post_id, db)
+    
+    if not post:
+        raise HTTPException(404)
+    
+    headers = validator_headers(
+        make_etag(post.id, post.updated_at),
+        post.updated_at,
+    )
+    if is_not_modified(request, headers):
+        return not_modified(headers)
+    
+    return Response(
+        content=PostRead.model_validate(post).model_dump_json(),
+        media_type="application/json",
+        headers=headers,
     )
-    return Page(total=total, limit=limit, offset=offset, items=items)
 
 @router.patch(
     "/{post_id}",
@@ -61,7 +260,7 @@ async def update_post(
     post_id: UUID,
     data: PostUpdate,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     post = await PostRepository.get_by_id(post_id, db)
     
@@ -83,7 +282,7 @@ async def update_post(
 async def delete_post(
     post_id: UUID,
     db: AsyncSession = Depends(get_db),
-    user: User = Depends(get_current_user),
+    user: Principal = Depends(get_current_user),
 ):
     post = await PostRepository.get_by_id(post_id, db)
     
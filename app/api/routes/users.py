@@ -1,15 +1,17 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.api.deps import require_roles
 from app.core.roles import UserRole
 from app.repositories.user import UserRepository
 from app.schemas.user import UserRead
 from app.schemas.user_admin import UserUpdateAdmin, UserCreateAdmin
-from app.schemas.pagination import Page
-from app.core.security import hash_password
+from app.schemas.pagination import Page, TotalMode
+from app.core.security import hash_password_async
+from app.services.export import ExportService, ExportFormat, MEDIA_TYPES
 
 router = APIRouter(
     prefix="/users",
@@ -24,10 +26,39 @@ router = APIRouter(
 async def get_users(
     limit: int = Query(10, le=100),
     offset: int = 0,
-    db: AsyncSession = Depends(get_db),
+    total_mode: TotalMode = Query(TotalMode.EXACT, alias="total"),
+    db: AsyncSession = Depends(get_read_db),
+):
+    total, items, has_more = await UserRepository.get_all(
+        db,
+        limit,
+        offset,
+        total_mode,
+    )
+    return Page(
+        total=total,
+        limit=limit,
+        offset=offset,
+        items=items,
+        total_mode=total_mode,
+        has_more=has_more,
+    )
+
+@router.get("/export")
+async def export_users(
+    request: Request,
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
 ):
-    total, items = await UserRepository.get_all(db, limit, offset)
-    return Page(total=total, limit=limit, offset=offset, items=items)
+    return StreamingResponse(
+        ExportService.stream(
+            request,
+            UserRepository.export_query(),
+            UserRead,
+            export_format,
+        ),
+        media_type=MEDIA_TYPES[export_format],
+        headers=ExportService.headers("users", export_format),
+    )
 
 @router.get(
     "/{user_id}",
@@ -35,7 +66,7 @@ async def get_users(
 )
 async def get_user(
     user_id: UUID,
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
 ):
     user = await UserRepository.get_by_id(user_id, db)
     if not user:
@@ -98,7 +129,7 @@ async def create_admin(
     db: AsyncSession = Depends(get_db),
 ):
     user_data = data.model_dump()
-    user_data["hashed_password"] = hash_password(data.password)
+    user_data["hashed_password"] = await hash_password_async(data.password)
     user_data.pop("password")
     
     return await UserRepository.create(user_data, db)
\ No newline at end of file
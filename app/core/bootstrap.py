@@ -1,51 +1,50 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select, exists, func
+from sqlalchemy.dialects.postgresql import insert
 from app.models.user import User
 from app.models.category import Category
 from app.core.roles import UserRole
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.core.config import settings
 
+# Arbitrary application-wide key; workers starting together serialize on it.
+BOOTSTRAP_LOCK_ID = 7_262_021_001
+
+async def bootstrap(db: AsyncSession):
+    await db.execute(select(func.pg_advisory_xact_lock(BOOTSTRAP_LOCK_ID)))
+    await create_first_category_if_not_exists(db)
+    await create_admin_if_not_exists(db)
+    await db.commit()
+
 async def create_admin_if_not_exists(db: AsyncSession):
-    result = await db.execute(
-        select(User).where(User.role == UserRole.ADMIN)
+    admin_exists = await db.scalar(
+        select(exists().where(User.role == UserRole.ADMIN))
     )
-    admin = result.scalars().first()
     
-    if admin:
+    if admin_exists:
         return
     
-    admin = User(
-        email=settings.admin_email,
-        hashed_password=hash_password(settings.admin_password),
-        role=UserRole.ADMIN,
+    hashed_password = (
+        settings.admin_password_hash
+        or await hash_password_async(settings.admin_password)
     )
     
-    db.add(admin)
-    
-    try:
-        await db.commit()
-    except IntegrityError:
-        await db.rollback()
+    await db.execute(
+        insert(User)
+        .values(
+            email=settings.admin_email,
+            hashed_password=hashed_password,
+            role=UserRole.ADMIN,
+        )
+        .on_conflict_do_nothing(index_elements=[User.email])
+    )
 
 async def create_first_category_if_not_exists(db: AsyncSession):
-    result = await db.execute(
-        select(Category).where(Category.name == "General")
-    )
-    category = result.scalars().first()
-    
-    if category:
-        return
-    
-    category = Category(
-        name="General",
-        description="Default category",
+    await db.execute(
+        insert(Category)
+        .values(
+            name="General",
+            description="Default category",
+        )
+        .on_conflict_do_nothing(index_elements=[Category.name])
     )
-    
-    db.add(category)
-    
-    try:
-        await db.commit()
-    except IntegrityError:
-        await db.rollback()
\ No newline at end of file
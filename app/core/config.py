@@ -1,5 +1,9 @@
 from pydantic_settings import BaseSettings
-from pydantic import Field, ConfigDict
+from pydantic import Field, ConfigDict, field_validator, model_validator
+
+import re
+
+BCRYPT_HASH_PATTERN = re.compile(r"^\$2[abxy]?\$\d{2}\$[./A-Za-z0-9]{53}$")
 
 class Settings(BaseSettings):
     app_name: str = Field(alias="APP_NAME")
@@ -11,15 +15,79 @@ class Settings(BaseSettings):
     postgres_user: str = Field(alias="POSTGRES_USER")
     postgres_password: str = Field(alias="POSTGRES_PASSWORD")
     
+    db_pool_size: int = Field(default=5, alias="DB_POOL_SIZE")
+    db_max_overflow: int = Field(default=10, alias="DB_MAX_OVERFLOW")
+    db_pool_timeout_seconds: float = Field(default=30, alias="DB_POOL_TIMEOUT_SECONDS")
+    db_pool_recycle_seconds: int = Field(default=1800, alias="DB_POOL_RECYCLE_SECONDS")
+    db_pool_pre_ping: bool = Field(default=True, alias="DB_POOL_PRE_PING")
+    db_pool_warmup: bool = Field(default=True, alias="DB_POOL_WARMUP")
+    db_connect_timeout_seconds: float = Field(default=10, alias="DB_CONNECT_TIMEOUT_SECONDS")
+    db_command_timeout_seconds: float = Field(default=30, alias="DB_COMMAND_TIMEOUT_SECONDS")
+    db_statement_cache_size: int = Field(default=100, alias="DB_STATEMENT_CACHE_SIZE")
+    
+    db_replica_urls: str = Field(default="", alias="DB_REPLICA_URLS")
+    db_replica_retry_seconds: int = Field(default=30, alias="DB_REPLICA_RETRY_SECONDS")
+    db_read_your_writes_seconds: int = Field(default=5, alias="DB_READ_YOUR_WRITES_SECONDS")
+    
     redis_host: str = Field(alias="REDIS_HOST")
     redis_port: int = Field(alias="REDIS_PORT")
+    redis_max_connections: int = Field(default=50, alias="REDIS_MAX_CONNECTIONS")
+    redis_pool_timeout_seconds: float = Field(default=1, alias="REDIS_POOL_TIMEOUT_SECONDS")
+    redis_socket_timeout_seconds: float = Field(default=1, alias="REDIS_SOCKET_TIMEOUT_SECONDS")
+    redis_connect_timeout_seconds: float = Field(default=1, alias="REDIS_CONNECT_TIMEOUT_SECONDS")
+    redis_health_check_interval_seconds: int = Field(default=30, alias="REDIS_HEALTH_CHECK_INTERVAL_SECONDS")
+    redis_retries: int = Field(default=1, alias="REDIS_RETRIES")
+    redis_pool_warmup: int = Field(default=5, alias="REDIS_POOL_WARMUP")
+    redis_breaker_failure_threshold: int = Field(default=5, alias="REDIS_BREAKER_FAILURE_THRESHOLD")
+    redis_breaker_reset_seconds: float = Field(default=10, alias="REDIS_BREAKER_RESET_SECONDS")
     
     secret_key: str = Field(alias="SECRET_KEY")
     access_token_expire_minutes: int = Field(alias="ACCESS_TOKEN_EXPIRE_MINUTES")
     refresh_token_expire_days: int = Field(alias="REFRESH_TOKEN_EXPIRE_DAYS")
     
     admin_email: str = Field(alias="ADMIN_EMAIL")
-    admin_password: str = Field(alias="ADMIN_PASSWORD")
+    admin_password: str = Field(default="", alias="ADMIN_PASSWORD")
+    admin_password_hash: str = Field(default="", alias="ADMIN_PASSWORD_HASH")
+    
+    password_hash_workers: int = Field(default=4, alias="PASSWORD_HASH_WORKERS")
+    password_hash_queue_limit: int = Field(default=64, alias="PASSWORD_HASH_QUEUE_LIMIT")
+    
+    principal_cache_ttl_seconds: int = Field(default=60, alias="PRINCIPAL_CACHE_TTL_SECONDS")
+    principal_cache_local_ttl_seconds: int = Field(default=5, alias="PRINCIPAL_CACHE_LOCAL_TTL_SECONDS")
+    principal_cache_max_size: int = Field(default=10000, alias="PRINCIPAL_CACHE_MAX_SIZE")
+    token_cache_max_size: int = Field(default=10000, alias="TOKEN_CACHE_MAX_SIZE")
+    
+    rate_limit_mode: str = Field(default="hybrid", alias="RATE_LIMIT_MODE")
+    rate_limit_sync_interval_ms: int = Field(default=100, alias="RATE_LIMIT_SYNC_INTERVAL_MS")
+    
+    response_cache_ttl_seconds: int = Field(default=30, alias="RESPONSE_CACHE_TTL_SECONDS")
+    count_cache_ttl_seconds: int = Field(default=60, alias="COUNT_CACHE_TTL_SECONDS")
+    
+    export_chunk_size: int = Field(default=1000, alias="EXPORT_CHUNK_SIZE")
+    
+    health_check_timeout_seconds: float = Field(default=1, alias="HEALTH_CHECK_TIMEOUT_SECONDS")
+    health_check_cache_ttl_seconds: float = Field(default=2, alias="HEALTH_CHECK_CACHE_TTL_SECONDS")
+    
+    compression_minimum_size: int = Field(default=1024, alias="COMPRESSION_MINIMUM_SIZE")
+    compression_gzip_level: int = Field(default=6, alias="COMPRESSION_GZIP_LEVEL")
+    compression_brotli_quality: int = Field(default=4, alias="COMPRESSION_BROTLI_QUALITY")
+    
+    query_profiling: bool = Field(default=False, alias="QUERY_PROFILING")
+    slow_query_ms: float = Field(default=200, alias="SLOW_QUERY_MS")
+    n_plus_one_threshold: int = Field(default=5, alias="N_PLUS_ONE_THRESHOLD")
+    
+    @field_validator("admin_password_hash")
+    @classmethod
+    def validate_admin_password_hash(cls, value: str) -> str:
+        if value and not BCRYPT_HASH_PATTERN.match(value):
+            raise ValueError("ADMIN_PASSWORD_HASH must be a bcrypt hash")
+        return value
+    
+    @model_validator(mode="after")
+    def validate_admin_credentials(self):
+        if bool(self.admin_password) == bool(self.admin_password_hash):
+            raise ValueError("Set exactly one of ADMIN_PASSWORD or ADMIN_PASSWORD_HASH")
+        return self
     
     @property
     def database_url(self) -> str:
@@ -29,6 +97,14 @@ class Settings(BaseSettings):
             f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
         )
     
+    @property
+    def replica_database_urls(self) -> list[str]:
+        return [url.strip() for url in self.db_replica_urls.split(",") if url.strip()]
+    
+    @property
+    def query_profiling_enabled(self) -> bool:
+        return self.query_profiling or self.debug
+    
     @property
     def redis_url(self) -> str:
         return f"redis://{self.redis_host}:{self.redis_port}"
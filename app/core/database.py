@@ -4,13 +4,91 @@ from sqlalchemy.ext.asyncio import (
     AsyncSession,
 )
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import text, exc, make_url
+from fastapi import Request
+from contextlib import AsyncExitStack
 from app.core.config import settings
+from app.core.metrics import instrument_engine
+from app.core.profiler import profile_engine
+from app.core.redis import redis_client
+from app.core.security import get_token_claims
 
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug,
-    future=True,
-)
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class PoolStats:
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+    
+    def record_wait(self, seconds: float):
+        self.checkouts += 1
+        self.wait_seconds_total += seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+    
+    def stats(self, pool) -> dict:
+        capacity = pool.size() + settings.db_max_overflow
+        checked_out = pool.checkedout()
+        return {
+            "size": pool.size(),
+            "max_overflow": settings.db_max_overflow,
+            "checked_out": checked_out,
+            "checked_in": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),
+            "saturation": checked_out / capacity if capacity else 0.0,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+        }
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolStats()
+    
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            self.wait_stats.timeouts += 1
+            raise
+        self.wait_stats.record_wait(time.perf_counter() - started)
+        return connection
+
+def create_engine(url: str, poolclass=InstrumentedPool):
+    url = make_url(url).update_query_dict({
+        "prepared_statement_cache_size": str(settings.db_statement_cache_size),
+    })
+    engine = create_async_engine(
+        url,
+        echo=settings.debug,
+        future=True,
+        poolclass=poolclass,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args={
+            "timeout": settings.db_connect_timeout_seconds,
+            "command_timeout": settings.db_command_timeout_seconds,
+            "statement_cache_size": settings.db_statement_cache_size,
+        },
+    )
+    instrument_engine(engine.sync_engine)
+    if settings.query_profiling_enabled:
+        profile_engine(engine.sync_engine)
+    return engine
+
+engine = create_engine(settings.database_url)
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -18,9 +96,163 @@ AsyncSessionLocal = async_sessionmaker(
     class_=AsyncSession,
 )
 
+class ReplicaRouter:
+    def __init__(self, urls: list[str], retry_seconds: int):
+        self.engines = [create_engine(url) for url in urls]
+        self.retry_seconds = retry_seconds
+        self._unhealthy_until = [0.0] * len(self.engines)
+        self._next = 0
+    
+    def candidates(self) -> list[int]:
+        now = time.monotonic()
+        start = self._next
+        self._next = (self._next + 1) % max(len(self.engines), 1)
+        
+        order = [
+            (start + offset) % len(self.engines)
+            for offset in range(len(self.engines))
+        ]
+        return [index for index in order if self._unhealthy_until[index] <= now]
+    
+    def mark_unhealthy(self, index: int):
+        self._unhealthy_until[index] = time.monotonic() + self.retry_seconds
+    
+    def status(self) -> list[dict]:
+        now = time.monotonic()
+        return [
+            {
+                "replica": index,
+                "healthy": self._unhealthy_until[index] <= now,
+                "pool": get_engine_pool_stats(self.engines[index]),
+            }
+            for index in range(len(self.engines))
+        ]
+
+replica_router = ReplicaRouter(
+    settings.replica_database_urls,
+    settings.db_replica_retry_seconds,
+)
+
+READ_YOUR_WRITES_COOKIE = "read_primary_until"
+READ_YOUR_WRITES_HEADER = "X-Read-Primary-Until"
+
 class Base(DeclarativeBase):
     pass
 
 async def get_db() -> AsyncSession:
     async with AsyncSessionLocal() as session:
-        yield session
\ No newline at end of file
+        yield session
+
+def _read_your_writes_key(subject) -> str:
+    return f"read-primary:{subject}"
+
+def _marker_active(read_primary_until: str | None) -> bool:
+    if not read_primary_until:
+        return False
+    
+    try:
+        return float(read_primary_until) > time.time()
+    except ValueError:
+        return False
+
+async def record_write(request: Request) -> str:
+    read_primary_until = str(time.time() + settings.db_read_your_writes_seconds)
+    
+    claims = get_token_claims(request)
+    if claims and claims.get("sub"):
+        try:
+            await redis_client.set(
+                _read_your_writes_key(claims["sub"]),
+                read_primary_until,
+                ex=settings.db_read_your_writes_seconds,
+            )
+        except Exception:
+            logger.warning("Read-your-writes marker write failed", exc_info=True)
+    
+    return read_primary_until
+
+async def prefers_primary(request: Request) -> bool:
+    if _marker_active(request.cookies.get(READ_YOUR_WRITES_COOKIE)):
+        return True
+    if _marker_active(request.headers.get(READ_YOUR_WRITES_HEADER)):
+        return True
+    
+    claims = get_token_claims(request)
+    if not claims or not claims.get("sub"):
+        return False
+    
+    try:
+        read_primary_until = await redis_client.get(_read_your_writes_key(claims["sub"]))
+    except Exception:
+        logger.warning("Read-your-writes marker read failed", exc_info=True)
+        return False
+    return _marker_active(read_primary_until)
+
+def replica_may_be_stale(request: Request, last_modified) -> bool:
+    if not getattr(request.state, "read_replica", False):
+        return False
+    return last_modified.timestamp() > time.time() - settings.db_read_your_writes_seconds
+
+async def get_read_db(request: Request) -> AsyncSession:
+    if replica_router.engines and not await prefers_primary(request):
+        for index in replica_router.candidates():
+            session = AsyncSessionLocal(bind=replica_router.engines[index])
+            try:
+                await session.connection()
+            except Exception:
+                await session.close()
+                replica_router.mark_unhealthy(index)
+                continue
+            
+            request.state.read_replica = True
+            async with session:
+                yield session
+            return
+    
+    async with AsyncSessionLocal() as session:
+        yield session
+
+async def warm_up_engine(engine):
+    async with AsyncExitStack() as stack:
+        async def open_connection():
+            connection = await stack.enter_async_context(engine.connect())
+            await connection.execute(text("SELECT 1"))
+        
+        # Every connection must be registered before the stack unwinds, so
+        # failures are collected rather than cancelling the others mid-open.
+        results = await asyncio.gather(
+            *(open_connection() for _ in range(settings.db_pool_size)),
+            return_exceptions=True,
+        )
+    
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+
+async def warm_up_pool():
+    primary, *replicas = await asyncio.gather(
+        warm_up_engine(engine),
+        *(warm_up_engine(replica) for replica in replica_router.engines),
+        return_exceptions=True,
+    )
+    
+    for index, result in enumerate(replicas):
+        if isinstance(result, BaseException):
+            logger.warning("Replica %d warm-up failed", index, exc_info=result)
+            replica_router.mark_unhealthy(index)
+    
+    if isinstance(primary, BaseException):
+        raise primary
+
+async def dispose_engines():
+    await asyncio.gather(
+        engine.dispose(),
+        *(replica.dispose() for replica in replica_router.engines),
+    )
+
+def get_engine_pool_stats(engine) -> dict:
+    pool = engine.sync_engine.pool
+    return pool.wait_stats.stats(pool)
+
+def get_pool_stats() -> dict:
+    return get_engine_pool_stats(engine)
@@ -0,0 +1,227 @@
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+UNMATCHED_ROUTE = "unmatched"
+
+request_scope: ContextVar[Scope | None] = ContextVar("request_scope", default=None)
+
+def escape_label(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def format_labels(names, values, extra: str = "") -> str:
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+def format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class Counter:
+    kind = "counter"
+    
+    def __init__(self, name: str, description: str, labels: tuple = ()):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.values = defaultdict(float)
+    
+    def inc(self, *label_values, amount: float = 1):
+        self.values[label_values] += amount
+    
+    def render(self) -> list[str]:
+        return [
+            f"{self.name}{format_labels(self.labels, label_values)} {format_value(value)}"
+            for label_values, value in sorted(self.values.items())
+        ]
+
+class Histogram:
+    kind = "histogram"
+    
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        labels: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = tuple(buckets)
+        self.series = {}
+    
+    def observe(self, value: float, *label_values):
+        series = self.series.get(label_values)
+        if series is None:
+            series = self.series[label_values] = {
+                "buckets": [0] * len(self.buckets),
+                "sum": 0.0,
+                "count": 0,
+            }
+        
+        index = bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series["buckets"][index] += 1
+        series["sum"] += value
+        series["count"] += 1
+    
+    def render(self) -> list[str]:
+        lines = []
+        for label_values, series in sorted(self.series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series["buckets"]):
+                cumulative += count
+                labels = format_labels(self.labels, label_values, f'le="{format_value(float(bound))}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            
+            labels = format_labels(self.labels, label_values, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {series['count']}")
+            
+            labels = format_labels(self.labels, label_values)
+            lines.append(f"{self.name}_sum{labels} {format_value(series['sum'])}")
+            lines.append(f"{self.name}_count{labels} {series['count']}")
+        return lines
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+    
+    def counter(self, name: str, description: str, labels: tuple = ()) -> Counter:
+        metric = Counter(name, description, labels)
+        self.metrics.append(metric)
+        return metric
+    
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: tuple = (),
+        buckets: tuple = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric = Histogram(name, description, labels, buckets)
+        self.metrics.append(metric)
+        return metric
+    
+    def collector(self, func):
+        self.collectors.append(func)
+        return func
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        
+        families = {}
+        for collector in self.collectors:
+            for name, kind, description, value, *labels in collector():
+                family = families.setdefault(name, (kind, description, []))
+                label_names, label_values = zip(*labels[0].items()) if labels else ((), ())
+                family[2].append(f"{name}{format_labels(label_names, label_values)} {format_value(value)}")
+        
+        for name, (kind, description, samples) in families.items():
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            lines.extend(samples)
+        
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "http_requests_total",
+    "HTTP requests by method, route template and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by method and route template.",
+    ("method", "route"),
+)
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds",
+    "Database statement latency by route template.",
+    ("route",),
+)
+redis_command_duration = registry.histogram(
+    "redis_command_duration_seconds",
+    "Redis command latency by command name.",
+    ("command",),
+)
+rate_limit_rejections = registry.counter(
+    "rate_limit_rejections_total",
+    "Requests rejected with 429 by limiter name.",
+    ("limiter",),
+)
+rate_limit_sync_failures = registry.counter(
+    "rate_limit_sync_failures_total",
+    "Hybrid limiter flushes to Redis that failed, by limiter name.",
+    ("limiter",),
+)
+
+def current_route() -> str:
+    scope = request_scope.get()
+    if scope is None:
+        return "none"
+    
+    route = scope.get("route")
+    return getattr(route, "path", UNMATCHED_ROUTE)
+
+def instrument_engine(sync_engine):
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        db_query_duration.observe(time.perf_counter() - started, current_route())
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("query_started") if context.connection else None
+        if started:
+            started.pop()
+
+class MetricsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        status_code = 500
+        
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+        
+        token = request_scope.set(scope)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = current_route()
+            http_request_duration.observe(
+                time.perf_counter() - started,
+                scope["method"],
+                route,
+            )
+            http_requests.inc(scope["method"], route, status_code)
+            request_scope.reset(token)
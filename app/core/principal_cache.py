@@ -0,0 +1,137 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.schemas.auth import Principal
+
+logger = logging.getLogger(__name__)
+
+INVALIDATION_CHANNEL = "principal:invalidate"
+
+# Stores a principal only if no invalidation bumped the user's version since
+# the caller read it, so a DB read that overlaps an update cannot repopulate
+# the cache with the old row.
+SET_IF_VERSION_SCRIPT = """
+local version = redis.call('GET', KEYS[2]) or ''
+if version ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[2], 'EX', ARGV[3])
+return 1
+"""
+
+set_if_version = redis_client.register_script(SET_IF_VERSION_SCRIPT)
+
+class PrincipalCache:
+    def __init__(self, ttl_seconds: int, local_ttl_seconds: int, max_size: int):
+        self.ttl = ttl_seconds
+        self.local_ttl = local_ttl_seconds
+        self.max_size = max_size
+        self._local: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+    
+    async def get_or_load(self, user_id: str, load) -> Principal | None:
+        user_id = str(user_id)
+        principal = self._get_local(user_id)
+        if principal:
+            return principal
+        
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.get(self._key(user_id))
+                pipe.get(self._version_key(user_id))
+                raw, version = await pipe.execute()
+        except Exception:
+            logger.warning("Principal cache read failed", exc_info=True)
+            return await load()
+        
+        if raw is not None:
+            principal = Principal.model_validate_json(raw)
+            self._set_local(principal)
+            return principal
+        
+        principal = await load()
+        if principal is not None:
+            await self._store(principal, version or "")
+        return principal
+    
+    async def invalidate(self, user_id):
+        user_id = str(user_id)
+        self._local.pop(user_id, None)
+        
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.incr(self._version_key(user_id))
+                pipe.expire(self._version_key(user_id), self.ttl)
+                pipe.delete(self._key(user_id))
+                pipe.publish(INVALIDATION_CHANNEL, user_id)
+                await pipe.execute()
+        except Exception:
+            logger.warning("Principal cache invalidation failed", exc_info=True)
+    
+    async def _store(self, principal: Principal, version: str):
+        try:
+            stored = await set_if_version(
+                keys=[self._key(principal.id), self._version_key(principal.id)],
+                args=[version, principal.model_dump_json(), self.ttl],
+            )
+        except Exception:
+            logger.warning("Principal cache write failed", exc_info=True)
+            return
+        
+        if stored:
+            self._set_local(principal)
+    
+    async def listen(self):
+        while True:
+            pubsub = redis_client.pubsub()
+            try:
+                await pubsub.subscribe(INVALIDATION_CHANNEL)
+                async for message in pubsub.listen():
+                    if message["type"] == "message":
+                        self._local.pop(message["data"], None)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Principal invalidation listener failed", exc_info=True)
+                self._local.clear()
+                await asyncio.sleep(1)
+            finally:
+                await pubsub.aclose()
+    
+    def _get_local(self, user_id: str) -> Principal | None:
+        entry = self._local.get(user_id)
+        if entry is None:
+            return None
+        
+        expires_at, principal = entry
+        if expires_at < time.monotonic():
+            self._local.pop(user_id, None)
+            return None
+        
+        self._local.move_to_end(user_id)
+        return principal
+    
+    def _set_local(self, principal: Principal):
+        user_id = str(principal.id)
+        self._local[user_id] = (time.monotonic() + self.local_ttl, principal)
+        self._local.move_to_end(user_id)
+        
+        while len(self._local) > self.max_size:
+            self._local.popitem(last=False)
+    
+    @staticmethod
+    def _key(user_id) -> str:
+        return f"principal:{user_id}"
+    
+    @staticmethod
+    def _version_key(user_id) -> str:
+        return f"principal-version:{user_id}"
+
+principal_cache = PrincipalCache(
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+    local_ttl_seconds=settings.principal_cache_local_ttl_seconds,
+    max_size=settings.principal_cache_max_size,
+)
@@ -0,0 +1,142 @@
+import json
+import logging
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import current_route
+
+logger = logging.getLogger(__name__)
+
+# Bound parameters in any paramstyle, with expanded IN lists collapsed to one.
+PARAMETER_PATTERN = re.compile(
+    r"(?:\$\d+|%s|%\(\w+\)s|\?)(?:\s*,\s*(?:\$\d+|%s|%\(\w+\)s|\?))*"
+)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+MAX_PARAMETER_LENGTH = 200
+
+def statement_shape(statement: str) -> str:
+    shape = PARAMETER_PATTERN.sub("?", statement)
+    return WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+def format_parameters(parameters) -> str:
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETER_LENGTH:
+        return text[:MAX_PARAMETER_LENGTH] + "..."
+    return text
+
+class QueryProfile:
+    def __init__(self, method: str):
+        self.method = method
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+    
+    def record(self, statement: str, parameters, duration: float):
+        self.count += 1
+        self.duration += duration
+        self.shapes[statement_shape(statement)] += 1
+        
+        if duration * 1000 >= settings.slow_query_ms:
+            logger.warning(json.dumps({
+                "event": "slow_query",
+                "method": self.method,
+                "route": current_route(),
+                "duration_ms": round(duration * 1000, 2),
+                "statement": statement_shape(statement),
+                "parameters": format_parameters(parameters),
+            }))
+    
+    def duplicates(self) -> dict[str, int]:
+        return {shape: count for shape, count in self.shapes.items() if count > 1}
+    
+    def n_plus_one(self) -> dict[str, int]:
+        return {
+            shape: count for shape, count in self.shapes.items()
+            if count >= settings.n_plus_one_threshold
+        }
+    
+    def summary(self) -> dict:
+        return {
+            "event": "request_queries",
+            "method": self.method,
+            "route": current_route(),
+            "queries": self.count,
+            "db_ms": round(self.duration * 1000, 2),
+            "duplicate_statements": sum(count - 1 for count in self.duplicates().values()),
+        }
+    
+    def server_timing(self) -> str:
+        return f'db;dur={self.duration * 1000:.2f};desc="{self.count} queries"'
+
+current_profile: ContextVar[QueryProfile | None] = ContextVar("current_profile", default=None)
+
+def profile_engine(sync_engine):
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if current_profile.get() is not None:
+            conn.info.setdefault("profile_started", []).append(time.perf_counter())
+    
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        profile = current_profile.get()
+        started = conn.info.get("profile_started")
+        if profile is None or not started:
+            return
+        profile.record(statement, parameters, time.perf_counter() - started.pop())
+    
+    @event.listens_for(sync_engine, "handle_error")
+    def handle_error(context):
+        started = context.connection.info.get("profile_started") if context.connection else None
+        if started:
+            started.pop()
+
+class ProfilerMiddleware:
+    def __init__(self, app: ASGIApp, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        profile = QueryProfile(scope["method"])
+        started = time.perf_counter()
+        
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and self.server_timing:
+                headers = MutableHeaders(raw=message["headers"])
+                headers.append(
+                    "Server-Timing",
+                    f"{profile.server_timing()}, "
+                    f"app;dur={(time.perf_counter() - started) * 1000:.2f}",
+                )
+            await send(message)
+        
+        token = current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_profile.reset(token)
+            self._report(profile)
+    
+    @staticmethod
+    def _report(profile: QueryProfile):
+        suspects = profile.n_plus_one()
+        if suspects:
+            logger.warning(json.dumps({
+                "event": "n_plus_one",
+                "method": profile.method,
+                "route": current_route(),
+                "statements": suspects,
+            }))
+        
+        if profile.count:
+            logger.info(json.dumps(profile.summary()))
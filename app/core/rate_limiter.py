@@ -1,41 +1,294 @@
-from fastapi import HTTPException, status, Request
+from fastapi import HTTPException, status, Request, Response
 from app.core.redis import redis_client
+from redis.exceptions import RedisError
+from app.core.metrics import rate_limit_rejections, rate_limit_sync_failures
+from app.core.security import get_token_claims
+from dataclasses import dataclass
+from enum import StrEnum
+import asyncio
+import logging
+import math
 import time
 
+logger = logging.getLogger(__name__)
+
+class RateLimitAlgorithm(StrEnum):
+    SLIDING_WINDOW = "sliding_window"
+    TOKEN_BUCKET = "token_bucket"
+
+class RateLimitMode(StrEnum):
+    REDIS = "redis"
+    HYBRID = "hybrid"
+
+# Weighted sliding window: the previous fixed window counts in proportion
+# to how much of it still overlaps the trailing window.
+SLIDING_WINDOW_SCRIPT = """
+local limit = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+
+local current_window = math.floor(now / window)
+local elapsed = now % window
+local current_key = KEYS[1] .. ':' .. current_window
+local previous_key = KEYS[1] .. ':' .. (current_window - 1)
+
+local current = tonumber(redis.call('GET', current_key) or '0')
+local previous = tonumber(redis.call('GET', previous_key) or '0')
+local count = previous * (window - elapsed) / window + current
+
+if count + cost > limit then
+    local retry_after = window - elapsed
+    if current + cost <= limit and previous > 0 then
+        retry_after = math.ceil(window - elapsed - (limit - cost - current) * window / previous)
+    end
+    return {0, math.max(math.floor(limit - count), 0), math.max(retry_after, 1)}
+end
+
+redis.call('INCRBY', current_key, cost)
+redis.call('PEXPIRE', current_key, window * 2)
+return {1, math.floor(limit - count - cost), 0}
+"""
+
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local rate = capacity / window
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(bucket[1]) or capacity
+local ts = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + (now - ts) * rate)
+
+local allowed = 0
+local retry_after = 0
+if tokens >= cost then
+    tokens = tokens - cost
+    allowed = 1
+elseif cost > capacity then
+    retry_after = window
+else
+    retry_after = math.ceil((cost - tokens) / rate)
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'ts', now)
+redis.call('PEXPIRE', KEYS[1], window)
+return {allowed, math.floor(tokens), retry_after}
+"""
+
+SCRIPTS = {
+    RateLimitAlgorithm.SLIDING_WINDOW: redis_client.register_script(SLIDING_WINDOW_SCRIPT),
+    RateLimitAlgorithm.TOKEN_BUCKET: redis_client.register_script(TOKEN_BUCKET_SCRIPT),
+}
+
+@dataclass
+class RateLimitResult:
+    limit: int
+    remaining: int
+    retry_after: int
+
+# Hybrid mode keeps the sliding-window counters of SLIDING_WINDOW_SCRIPT in
+# worker memory. `synced` is the global count Redis reported for the current
+# window at the last sync (including this worker's share), `pending` the
+# increments admitted locally since then, and `previous` the final count of
+# the window before.
+@dataclass
+class LocalWindow:
+    window: int
+    synced: int = 0
+    pending: int = 0
+    previous: int = 0
+    refreshed_at: float = 0.0
+
 class RateLimiter:
-    def __init__(self, limit: int, window_seconds: int):
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: int,
+        name: str = "global",
+        algorithm: RateLimitAlgorithm = RateLimitAlgorithm.SLIDING_WINDOW,
+        mode: RateLimitMode = RateLimitMode.REDIS,
+        sync_interval_seconds: float = 0.1,
+        idle_refresh_seconds: float = 1.0,
+    ):
+        if mode == RateLimitMode.HYBRID and algorithm != RateLimitAlgorithm.SLIDING_WINDOW:
+            raise ValueError("Hybrid rate limiting only supports the sliding window algorithm")
+        
         self.limit = limit
         self.window = window_seconds
+        self.name = name
+        self.algorithm = algorithm
+        self.mode = mode
+        self.sync_interval = sync_interval_seconds
+        self.idle_refresh = idle_refresh_seconds
+        self.degraded = False
+        self._script = SCRIPTS[algorithm]
+        self._windows: dict[str, LocalWindow] = {}
+        self._pruned_window = 0
+    
+    async def __call__(self, request: Request, response: Response):
+        result = await self.check(request)
+        self.apply_headers(response, result)
     
-    async def __call__(self, request: Request):
+    async def check(self, request: Request, cost: int = 1) -> RateLimitResult:
+        self.check_cost(cost)
         identifier = await self._get_identifier(request)
+        key = f"rate:{self.name}:{identifier}"
         
-        window = int(time.time() // self.window)
-        key = f"rate:{identifier}:{window}"
-        
-        current = await redis_client.incr(key)
+        if self.mode == RateLimitMode.HYBRID:
+            allowed, remaining, retry_after_ms = self._check_local(key, cost)
+        else:
+            try:
+                allowed, remaining, retry_after_ms = await self._script(
+                    keys=[key],
+                    args=[self.limit, self.window * 1000, cost],
+                )
+                self.degraded = False
+            except RedisError:
+                if not self.degraded:
+                    logger.warning("Rate limiter %s fell back to local counts", self.name, exc_info=True)
+                self.degraded = True
+                allowed, remaining, retry_after_ms = self._check_local(key, cost)
         
-        if current == 1:
-            await redis_client.expire(key, self.window)
+        result = RateLimitResult(
+            limit=self.limit,
+            remaining=max(int(remaining), 0),
+            retry_after=math.ceil(int(retry_after_ms) / 1000),
+        )
         
-        if current > self.limit:
+        if not allowed:
+            rate_limit_rejections.inc(self.name)
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail="Too many requests",
+                headers=self.headers(result),
             )
+        
+        return result
+    
+    def check_cost(self, cost: int):
+        if cost > self.limit:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"At most {self.limit} items are allowed per {self.window} seconds",
+            )
+    
+    async def sync(self):
+        now = time.time()
+        current = int(now // self.window)
+        self._prune(current)
+        
+        # Keys with local increments are flushed every interval; idle keys
+        # only re-read the global count now and then, so Redis load follows
+        # traffic rather than the number of known clients.
+        flushed = {
+            key: counter.pending for key, counter in self._windows.items()
+            if counter.window == current and counter.pending > 0
+        }
+        refreshed = [
+            key for key, counter in self._windows.items()
+            if counter.window == current
+            and counter.pending == 0
+            and now - counter.refreshed_at >= self.idle_refresh
+        ]
+        if not flushed and not refreshed:
+            return
+        
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for key, pending in flushed.items():
+                    pipe.incrby(f"{key}:{current}", pending)
+                    pipe.expire(f"{key}:{current}", self.window * 2)
+                for key in refreshed:
+                    pipe.get(f"{key}:{current}")
+                replies = await pipe.execute()
+        except Exception:
+            rate_limit_sync_failures.inc(self.name)
+            if not self.degraded:
+                logger.warning("Rate limiter %s fell back to local counts", self.name, exc_info=True)
+            self.degraded = True
+            return
+        
+        self.degraded = False
+        totals = replies[:len(flushed) * 2:2] + replies[len(flushed) * 2:]
+        pending_counts = list(flushed.values()) + [0] * len(refreshed)
+        
+        for key, pending, total in zip([*flushed, *refreshed], pending_counts, totals):
+            counter = self._windows.get(key)
+            if counter is None or counter.window != current:
+                continue
+            counter.synced = max(int(total or 0), counter.synced + pending)
+            counter.pending -= pending
+            counter.refreshed_at = now
+    
+    async def run_sync(self):
+        while True:
+            await asyncio.sleep(self.sync_interval)
+            await self.sync()
+    
+    def _check_local(self, key: str, cost: int) -> tuple[int, int, int]:
+        now = time.time()
+        current = int(now // self.window)
+        elapsed = now - current * self.window
+        self._prune(current)
+        
+        counter = self._windows.get(key)
+        if counter is None or counter.window != current:
+            previous = 0
+            if counter is not None and counter.window == current - 1:
+                previous = counter.synced + counter.pending
+            counter = self._windows[key] = LocalWindow(window=current, previous=previous)
+        
+        current_count = counter.synced + counter.pending
+        count = counter.previous * (self.window - elapsed) / self.window + current_count
+        
+        if count + cost > self.limit:
+            retry_after = self.window - elapsed
+            if current_count + cost <= self.limit and counter.previous > 0:
+                retry_after -= (self.limit - cost - current_count) * self.window / counter.previous
+            return 0, math.floor(self.limit - count), max(math.ceil(retry_after * 1000), 1)
+        
+        counter.pending += cost
+        return 1, math.floor(self.limit - count - cost), 0
+    
+    def _prune(self, current: int):
+        # Windows older than the previous one no longer affect any count;
+        # dropping them once per window keeps memory bounded by the clients
+        # seen recently, even while Redis is unavailable and sync() is idle.
+        if current == self._pruned_window:
+            return
+        self._windows = {
+            key: counter for key, counter in self._windows.items()
+            if counter.window >= current - 1
+        }
+        self._pruned_window = current
+    
+    def apply_headers(self, response: Response, result: RateLimitResult):
+        response.headers.update(self.headers(result))
+    
+    def apply_default_headers(self, response: Response, result: RateLimitResult):
+        for name, value in self.headers(result).items():
+            response.headers.setdefault(name, value)
+    
+    @staticmethod
+    def headers(result: RateLimitResult) -> dict:
+        headers = {
+            "X-RateLimit-Limit": str(result.limit),
+            "X-RateLimit-Remaining": str(result.remaining),
+        }
+        if result.retry_after:
+            headers["Retry-After"] = str(result.retry_after)
+        return headers
     
     async def _get_identifier(self, request: Request) -> str:
-        auth = request.headers.get("authorization")
+        claims = get_token_claims(request)
         
-        if auth and auth.startswith("Bearer "):
-            from app.core.security import decode_token
-            
-            token = auth.split(" ")[1]
-            try:
-                payload = decode_token(token)
-                return f"user:{payload('sub')}"
-            except Exception:
-                pass
+        if claims and claims.get("sub"):
+            return f"user:{claims['sub']}"
         
         client_ip = request.client.host
-        return f"ip:{client_ip}"
\ No newline at end of file
+        return f"ip:{client_ip}"
@@ -1,4 +1,153 @@
 import redis.asyncio as redis
+from redis.asyncio.client import Pipeline
+from redis.asyncio.retry import Retry
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError, TimeoutError
+from enum import StrEnum
 from app.core.config import settings
+from app.core.metrics import redis_command_duration
 
-redis_client = redis.from_url(settings.redis_url, decode_responses=True)
\ No newline at end of file
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+class CircuitOpenError(ConnectionError):
+    pass
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.failures = 0
+        self.opened_at = 0.0
+        self.short_circuited = 0
+        self._state = BreakerState.CLOSED
+        self._probe_started_at: float | None = None
+    
+    @property
+    def state(self) -> BreakerState:
+        if (
+            self._state == BreakerState.OPEN
+            and time.monotonic() - self.opened_at >= self.reset_seconds
+        ):
+            self._state = BreakerState.HALF_OPEN
+        return self._state
+    
+    def before_call(self):
+        state = self.state
+        if state == BreakerState.HALF_OPEN:
+            # Admit a single probe; a probe that never reports back (for
+            # example a cancelled request) is replaced after reset_seconds.
+            now = time.monotonic()
+            if (
+                self._probe_started_at is None
+                or now - self._probe_started_at >= self.reset_seconds
+            ):
+                self._probe_started_at = now
+                return
+        
+        if state != BreakerState.CLOSED:
+            self.short_circuited += 1
+            raise CircuitOpenError("Redis circuit breaker is open")
+    
+    def record_success(self):
+        self.failures = 0
+        self._state = BreakerState.CLOSED
+        self._probe_started_at = None
+    
+    def record_failure(self):
+        self.failures += 1
+        self._probe_started_at = None
+        if self._state == BreakerState.HALF_OPEN or self.failures >= self.failure_threshold:
+            self._state = BreakerState.OPEN
+            self.opened_at = time.monotonic()
+    
+    def status(self) -> dict:
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "short_circuited": self.short_circuited,
+        }
+
+redis_breaker = CircuitBreaker(
+    failure_threshold=settings.redis_breaker_failure_threshold,
+    reset_seconds=settings.redis_breaker_reset_seconds,
+)
+
+# Only transport failures trip the breaker; command errors such as WRONGTYPE
+# or NOSCRIPT mean Redis answered and count as a success.
+TRANSPORT_ERRORS = (ConnectionError, TimeoutError, OSError)
+
+class BreakerPipeline(Pipeline):
+    async def execute(self, raise_on_error: bool = True):
+        redis_breaker.before_call()
+        started = time.perf_counter()
+        try:
+            result = await super().execute(raise_on_error)
+        except TRANSPORT_ERRORS:
+            redis_breaker.record_failure()
+            raise
+        except Exception:
+            redis_breaker.record_success()
+            raise
+        finally:
+            # Queued commands bypass execute_command, so time the round trip as a whole.
+            redis_command_duration.observe(time.perf_counter() - started, "PIPELINE")
+        redis_breaker.record_success()
+        return result
+
+class InstrumentedRedis(redis.Redis):
+    async def execute_command(self, *args, **options):
+        redis_breaker.before_call()
+        started = time.perf_counter()
+        try:
+            result = await super().execute_command(*args, **options)
+        except TRANSPORT_ERRORS:
+            redis_breaker.record_failure()
+            raise
+        except Exception:
+            redis_breaker.record_success()
+            raise
+        finally:
+            redis_command_duration.observe(
+                time.perf_counter() - started,
+                str(args[0]).upper(),
+            )
+        redis_breaker.record_success()
+        return result
+    
+    def pipeline(self, transaction: bool = True, shard_hint: str | None = None) -> BreakerPipeline:
+        return BreakerPipeline(
+            self.connection_pool,
+            self.response_callbacks,
+            transaction,
+            shard_hint,
+        )
+
+redis_pool = redis.BlockingConnectionPool.from_url(
+    settings.redis_url,
+    decode_responses=True,
+    max_connections=settings.redis_max_connections,
+    timeout=settings.redis_pool_timeout_seconds,
+    socket_timeout=settings.redis_socket_timeout_seconds,
+    socket_connect_timeout=settings.redis_connect_timeout_seconds,
+    health_check_interval=settings.redis_health_check_interval_seconds,
+    retry=Retry(ExponentialBackoff(cap=0.5, base=0.01), settings.redis_retries),
+)
+
+redis_client = InstrumentedRedis(connection_pool=redis_pool)
+
+async def warm_up_redis_pool():
+    try:
+        await asyncio.gather(
+            *(redis_client.ping() for _ in range(settings.redis_pool_warmup))
+        )
+    except Exception:
+        logger.warning("Redis pool warm-up failed", exc_info=True)
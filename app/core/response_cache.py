@@ -0,0 +1,129 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime, timezone
+
+from app.core.config import settings
+from app.core.redis import redis_client
+
+logger = logging.getLogger(__name__)
+
+POST_LIST_TAG = "posts"
+CATEGORY_LIST_TAG = "categories"
+AUTHOR_TAG = "authors"
+
+# Tag versions outlive cached bodies so validators stay stable between
+# writes; an expired version restarts with a fresh modified_at.
+VERSION_TTL_SECONDS = 24 * 60 * 60
+
+def category_tag(category_id) -> str:
+    return f"category:{category_id}"
+
+def post_tag(post_id) -> str:
+    return f"post:{post_id}"
+
+class ResponseCache:
+    def __init__(self, ttl_seconds: int):
+        self.ttl = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    @staticmethod
+    def make_key(namespace: str, **params) -> str:
+        normalized = sorted(
+            (key, str(value)) for key, value in params.items()
+            if value is not None
+        )
+        digest = hashlib.sha1(json.dumps(normalized).encode()).hexdigest()
+        return f"cache:{namespace}:{digest}"
+    
+    async def get(self, key: str) -> tuple[str, dict] | None:
+        try:
+            entry = await redis_client.hgetall(key)
+        except Exception:
+            logger.warning("Response cache read failed", exc_info=True)
+            entry = None
+        
+        if not entry:
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        body = entry.pop("body")
+        return body, entry
+    
+    async def set(
+        self,
+        key: str,
+        body: str,
+        tags: list[str],
+        headers: dict | None = None,
+    ):
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                pipe.delete(key)
+                pipe.hset(key, mapping={"body": body, **(headers or {})})
+                pipe.expire(key, self.ttl)
+                for tag in tags:
+                    pipe.sadd(self._tag_key(tag), key)
+                    pipe.expire(self._tag_key(tag), self.ttl)
+                await pipe.execute()
+        except Exception:
+            logger.warning("Response cache write failed", exc_info=True)
+    
+    async def versions(self, *tags: str) -> tuple[str, datetime] | None:
+        now = time.time()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.hsetnx(self._version_key(tag), "version", 0)
+                    pipe.hsetnx(self._version_key(tag), "modified_at", now)
+                    pipe.expire(self._version_key(tag), VERSION_TTL_SECONDS)
+                    pipe.hgetall(self._version_key(tag))
+                entries = (await pipe.execute())[3::4]
+        except Exception:
+            logger.warning("Response cache version read failed", exc_info=True)
+            return None
+        
+        version = ",".join(f"{entry['version']}@{entry['modified_at']}" for entry in entries)
+        modified_at = max(float(entry["modified_at"]) for entry in entries)
+        return version, datetime.fromtimestamp(modified_at, timezone.utc)
+    
+    async def invalidate(self, *tags: str):
+        now = time.time()
+        try:
+            async with redis_client.pipeline(transaction=False) as pipe:
+                for tag in tags:
+                    pipe.hincrby(self._version_key(tag), "version", 1)
+                    pipe.hset(self._version_key(tag), "modified_at", now)
+                    pipe.expire(self._version_key(tag), VERSION_TTL_SECONDS)
+                    pipe.smembers(self._tag_key(tag))
+                members = (await pipe.execute())[3::4]
+            
+            keys = set().union(*members)
+            if not keys:
+                return
+            
+            await redis_client.delete(*keys, *(self._tag_key(tag) for tag in tags))
+            self.evictions += len(keys)
+        except Exception:
+            logger.warning("Response cache invalidation failed", exc_info=True)
+    
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+    
+    @staticmethod
+    def _tag_key(tag: str) -> str:
+        return f"cache-tag:{tag}"
+    
+    @staticmethod
+    def _version_key(tag: str) -> str:
+        return f"cache-version:{tag}"
+
+response_cache = ResponseCache(ttl_seconds=settings.response_cache_ttl_seconds)
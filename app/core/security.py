@@ -1,20 +1,135 @@
 from datetime import datetime, timedelta
-from jose import jwt
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Mapping
+from fastapi import HTTPException, Request, status
+from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
 
+import asyncio
 import bcrypt
+import hashlib
+import threading
+import time
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 ALGORITHM = "HS256"
 
+class PasswordHasher:
+    def __init__(self, workers: int, queue_limit: int):
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.in_flight = 0
+        self.queued = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="password-hasher",
+        )
+    
+    async def hash(self, password: str) -> str:
+        return await self._submit(pwd_context.hash, password)
+    
+    async def verify(self, password: str, hashed: str) -> bool:
+        return await self._submit(pwd_context.verify, password, hashed)
+    
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "in_flight": self.in_flight,
+                "queued": self.queued,
+                "rejected": self.rejected,
+            }
+    
+    async def _submit(self, func, *args):
+        with self._lock:
+            if self.queued >= self.queue_limit:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Password hashing is overloaded",
+                )
+            self.queued += 1
+        
+        future = self._executor.submit(self._run, func, *args)
+        future.add_done_callback(self._release_cancelled)
+        return await asyncio.wrap_future(future)
+    
+    def _release_cancelled(self, future):
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+    
+    def _run(self, func, *args):
+        with self._lock:
+            self.queued -= 1
+            self.in_flight += 1
+        try:
+            return func(*args)
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+password_hasher = PasswordHasher(
+    workers=settings.password_hash_workers,
+    queue_limit=settings.password_hash_queue_limit,
+)
+
 def hash_password(password: str) -> str:
     return pwd_context.hash(password)
 
 def verify_password(password: str, hashed: str) -> bool:
     return pwd_context.verify(password, hashed)
 
+async def hash_password_async(password: str) -> str:
+    return await password_hasher.hash(password)
+
+async def verify_password_async(password: str, hashed: str) -> bool:
+    return await password_hasher.verify(password, hashed)
+
+class VerifiedTokenCache:
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, dict] = OrderedDict()
+    
+    def verify(self, token: str) -> Mapping:
+        key = hashlib.sha256(token.encode()).hexdigest()
+        
+        payload = self._entries.get(key)
+        if payload is not None:
+            if payload.get("exp", 0) > time.time():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return MappingProxyType(payload)
+            del self._entries[key]
+        
+        self.misses += 1
+        payload = decode_token(token)
+        
+        if "exp" in payload:
+            self._entries[key] = payload
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        
+        # Entries are shared across requests, so callers get a read-only view.
+        return MappingProxyType(payload)
+    
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+verified_token_cache = VerifiedTokenCache(max_size=settings.token_cache_max_size)
+
 def create_access_token(data: dict) -> str:
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(
@@ -33,3 +148,18 @@ def create_refresh_token(data: dict) -> str:
 
 def decode_token(token: str) -> dict:
     return jwt.decode(token, settings.secret_key, algorithms=[ALGORITHM])
+
+def get_token_claims(request: Request) -> Mapping | None:
+    if hasattr(request.state, "token_claims"):
+        return request.state.token_claims
+    
+    claims = None
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() == "bearer" and token:
+        try:
+            claims = verified_token_cache.verify(token)
+        except JWTError:
+            claims = None
+    
+    request.state.token_claims = claims
+    return claims
\ No newline at end of file
@@ -1,31 +1,123 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 from app.core.config import settings
-from app.api.routes import health, auth, categories, posts, comments, users
-from app.core.database import AsyncSessionLocal
-from app.core.bootstrap import create_admin_if_not_exists, create_first_category_if_not_exists
-from app.core.rate_limiter import RateLimiter
+from app.api.routes import health, auth, categories, posts, comments, users, metrics
+from app.core.database import (
+    AsyncSessionLocal,
+    warm_up_pool,
+    dispose_engines,
+    replica_router,
+    READ_YOUR_WRITES_COOKIE,
+    READ_YOUR_WRITES_HEADER,
+    record_write,
+)
+from app.core.bootstrap import bootstrap
+from app.core.redis import warm_up_redis_pool
+from app.core.rate_limiter import RateLimiter, RateLimitAlgorithm, RateLimitMode
+from app.core.principal_cache import principal_cache
+from app.core.compression import CompressionMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.profiler import ProfilerMiddleware
+
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+async def prepare_database():
+    async with AsyncSessionLocal() as db:
+        await bootstrap(db)
+    
+    if settings.db_pool_warmup:
+        await warm_up_pool()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    async with AsyncSessionLocal() as db:
-        await create_admin_if_not_exists(db)
-        await create_first_category_if_not_exists(db)
+    started = time.perf_counter()
+    await asyncio.gather(prepare_database(), warm_up_redis_pool())
+    logger.info("Startup completed in %.1f ms", (time.perf_counter() - started) * 1000)
+    
+    background_tasks = [asyncio.create_task(principal_cache.listen())]
+    if global_limiter.mode == RateLimitMode.HYBRID:
+        background_tasks.append(asyncio.create_task(global_limiter.run_sync()))
     
     yield
+    
+    for task in background_tasks:
+        task.cancel()
+    await asyncio.gather(*background_tasks, return_exceptions=True)
+    await dispose_engines()
+
+app = FastAPI(
+    title=settings.app_name,
+    lifespan=lifespan,
+)
 
-app = FastAPI(title=settings.app_name, lifespan=lifespan)
+global_limiter_mode = RateLimitMode(settings.rate_limit_mode)
 
-global_limiter = RateLimiter(limit=100, window_seconds=60)
+# Hybrid counting mirrors the sliding window script; the Redis-only mode keeps
+# the token bucket.
+global_limiter = RateLimiter(
+    limit=100,
+    window_seconds=60,
+    name="global",
+    algorithm=(
+        RateLimitAlgorithm.SLIDING_WINDOW
+        if global_limiter_mode == RateLimitMode.HYBRID
+        else RateLimitAlgorithm.TOKEN_BUCKET
+    ),
+    mode=global_limiter_mode,
+    sync_interval_seconds=settings.rate_limit_sync_interval_ms / 1000,
+)
 
 if not settings.debug:
     @app.middleware("http")
     async def global_rate_limit(request, call_next):
-        await global_limiter(request)
+        try:
+            result = await global_limiter.check(request)
+        except HTTPException as exc:
+            return JSONResponse(
+                {"detail": exc.detail},
+                status_code=exc.status_code,
+                headers=exc.headers,
+            )
+        
         response = await call_next(request)
+        # A route limiter that already reported its own budget wins.
+        global_limiter.apply_default_headers(response, result)
         return response
 
+if replica_router.engines:
+    @app.middleware("http")
+    async def read_your_writes(request, call_next):
+        response = await call_next(request)
+        
+        if request.method not in ("GET", "HEAD", "OPTIONS") and response.status_code < 400:
+            read_primary_until = await record_write(request)
+            response.set_cookie(
+                READ_YOUR_WRITES_COOKIE,
+                read_primary_until,
+                max_age=settings.db_read_your_writes_seconds,
+                httponly=True,
+            )
+            response.headers[READ_YOUR_WRITES_HEADER] = read_primary_until
+        
+        return response
+
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+)
+if settings.query_profiling_enabled:
+    app.add_middleware(ProfilerMiddleware, server_timing=settings.debug)
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(auth.router)
 app.include_router(categories.router)
 app.include_router(posts.router)
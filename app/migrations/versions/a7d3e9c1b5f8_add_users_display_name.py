@@ -0,0 +1,28 @@
+"""add users display name
+
+Revision ID: a7d3e9c1b5f8
+Revises: f6b9d1e4a3c2
+Create Date: 2026-10-18 19:41:27.503918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3e9c1b5f8'
+down_revision: Union[str, Sequence[str], None] = 'f6b9d1e4a3c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('display_name', sa.String(length=50), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'display_name')
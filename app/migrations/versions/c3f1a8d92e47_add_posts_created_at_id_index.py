@@ -0,0 +1,27 @@
+"""add posts created_at id index
+
+Revision ID: c3f1a8d92e47
+Revises: bb4c1e41659c
+Create Date: 2026-10-18 10:12:04.318205
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f1a8d92e47'
+down_revision: Union[str, Sequence[str], None] = 'bb4c1e41659c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posts_created_at_id', 'posts', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_created_at_id', table_name='posts')
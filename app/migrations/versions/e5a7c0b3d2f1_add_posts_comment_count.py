@@ -0,0 +1,43 @@
+"""add posts comment count
+
+Revision ID: e5a7c0b3d2f1
+Revises: d84b2c6e1f90
+Create Date: 2026-10-18 15:06:51.774392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c0b3d2f1'
+down_revision: Union[str, Sequence[str], None] = 'd84b2c6e1f90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('comment_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE posts
+        SET comment_count = counts.total
+        FROM (
+            SELECT post_id, count(*) AS total
+            FROM comments
+            WHERE is_deleted = false
+            GROUP BY post_id
+        ) AS counts
+        WHERE posts.id = counts.post_id
+        """
+    )
+    op.create_index('ix_posts_comment_count_created_at_id', 'posts', ['comment_count', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_comment_count_created_at_id', table_name='posts')
+    op.drop_column('posts', 'comment_count')
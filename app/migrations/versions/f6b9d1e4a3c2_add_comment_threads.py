@@ -0,0 +1,45 @@
+"""add comment threads
+
+Revision ID: f6b9d1e4a3c2
+Revises: e5a7c0b3d2f1
+Create Date: 2026-10-18 16:22:09.115847
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b9d1e4a3c2'
+down_revision: Union[str, Sequence[str], None] = 'e5a7c0b3d2f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('comments', sa.Column('parent_id', sa.UUID(), nullable=True))
+    op.add_column('comments', sa.Column('path', sa.Text(collation='C'), nullable=True))
+    op.add_column('comments', sa.Column('depth', sa.Integer(), server_default='0', nullable=False))
+    op.create_foreign_key('comments_parent_id_fkey', 'comments', 'comments', ['parent_id'], ['id'], ondelete='CASCADE')
+    # Existing comments become top-level threads, ordered by creation time.
+    op.execute(
+        """
+        UPDATE comments
+        SET path = lpad(to_hex((extract(epoch FROM created_at) * 1000000000)::bigint), 16, '0')
+            || substr(replace(id::text, '-', ''), 1, 8)
+        """
+    )
+    op.alter_column('comments', 'path', nullable=False)
+    op.create_index('ix_comments_post_id_path', 'comments', ['post_id', 'path'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_comments_post_id_path', table_name='comments')
+    op.drop_constraint('comments_parent_id_fkey', 'comments', type_='foreignkey')
+    op.drop_column('comments', 'depth')
+    op.drop_column('comments', 'path')
+    op.drop_column('comments', 'parent_id')
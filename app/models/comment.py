@@ -1,4 +1,4 @@
-from sqlalchemy import Text, ForeignKey
+from sqlalchemy import Text, ForeignKey, Integer, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 
@@ -6,6 +6,9 @@ from app.models.base import BaseModel
 
 class Comment(BaseModel):
     __tablename__ = "comments"
+    __table_args__ = (
+        Index("ix_comments_post_id_path", "post_id", "path"),
+    )
     
     content: Mapped[str] = mapped_column(
         Text,
@@ -24,5 +27,22 @@ class Comment(BaseModel):
         index=True,
     )
     
+    parent_id: Mapped[UUID | None] = mapped_column(
+        ForeignKey("comments.id", ondelete="CASCADE"),
+        nullable=True,
+    )
+    
+    path: Mapped[str] = mapped_column(
+        Text(collation="C"),
+        nullable=False,
+    )
+    
+    depth: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    
     post = relationship("Post")
     author = relationship("User")
\ No newline at end of file
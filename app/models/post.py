@@ -1,4 +1,5 @@
-from sqlalchemy import String, Text, ForeignKey
+from sqlalchemy import String, Text, ForeignKey, Index, Computed, Integer
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from uuid import UUID
 
@@ -6,6 +7,11 @@ from app.models.base import BaseModel
 
 class Post(BaseModel):
     __tablename__ = "posts"
+    __table_args__ = (
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        Index("ix_posts_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_posts_comment_count_created_at_id", "comment_count", "created_at", "id"),
+    )
     
     title: Mapped[str] = mapped_column(
         String(255),
@@ -28,5 +34,22 @@ class Post(BaseModel):
         nullable=False,
     )
     
+    comment_count: Mapped[int] = mapped_column(
+        Integer,
+        default=0,
+        server_default="0",
+        nullable=False,
+    )
+    
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+            "setweight(to_tsvector('english', coalesce(content, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    
     author = relationship("User")
     category = relationship("Category")
\ No newline at end of file
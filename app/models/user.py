@@ -13,6 +13,11 @@ class User(BaseModel):
         nullable=False,
     )
     
+    display_name: Mapped[str | None] = mapped_column(
+        String(50),
+        nullable=True,
+    )
+    
     hashed_password: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
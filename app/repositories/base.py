@@ -0,0 +1,84 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import insert, update, delete
+from sqlalchemy.orm.attributes import set_committed_value
+
+class BaseRepository:
+    model = None
+    
+    @classmethod
+    async def create(cls, data: dict, db: AsyncSession):
+        obj = await cls._insert(data, db)
+        await db.commit()
+        return obj
+    
+    @classmethod
+    async def bulk_create(cls, rows: list[dict], db: AsyncSession) -> list:
+        objs = await cls._bulk_insert(rows, db)
+        await db.commit()
+        return objs
+    
+    @classmethod
+    async def update(cls, obj, data: dict, db: AsyncSession):
+        if not data:
+            return obj
+        
+        result = await db.scalars(
+            update(cls.model)
+            .where(cls.model.id == obj.id)
+            .values(**data)
+            .returning(cls.model)
+            .execution_options(populate_existing=True)
+        )
+        obj = result.one()
+        await db.commit()
+        return obj
+    
+    @classmethod
+    async def soft_delete(cls, obj, db: AsyncSession):
+        await cls._soft_delete(obj, db)
+        await db.commit()
+        set_committed_value(obj, "is_deleted", True)
+    
+    @classmethod
+    async def hard_delete(cls, obj, db: AsyncSession):
+        await cls._hard_delete(obj, db)
+        await db.commit()
+        
+        if obj in db:
+            db.expunge(obj)
+    
+    @classmethod
+    async def _insert(cls, data: dict, db: AsyncSession):
+        result = await db.scalars(
+            insert(cls.model).values(**data).returning(cls.model)
+        )
+        return result.one()
+    
+    @classmethod
+    async def _bulk_insert(cls, rows: list[dict], db: AsyncSession) -> list:
+        result = await db.scalars(
+            insert(cls.model).returning(cls.model, sort_by_parameter_order=True),
+            rows,
+        )
+        return result.all()
+    
+    @classmethod
+    async def _soft_delete(cls, obj, db: AsyncSession) -> bool:
+        result = await db.execute(
+            update(cls.model)
+            .where(
+                cls.model.id == obj.id,
+                cls.model.is_deleted == False
+            )
+            .values(is_deleted=True)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount > 0
+    
+    @classmethod
+    async def _hard_delete(cls, obj, db: AsyncSession):
+        await db.execute(
+            delete(cls.model)
+            .where(cls.model.id == obj.id)
+            .execution_options(synchronize_session=False)
+        )
@@ -1,15 +1,28 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from app.models.category import Category
+from app.repositories.base import BaseRepository
+from app.core.response_cache import (
+    response_cache,
+    POST_LIST_TAG,
+    CATEGORY_LIST_TAG,
+    category_tag,
+)
+from app.repositories.counts import count_total
+from app.schemas.pagination import TotalMode
 
-class CategoryRepository:
+class CategoryRepository(BaseRepository):
+    model = Category
+    
     @staticmethod
-    async def create(data: dict, db: AsyncSession) -> Category:
-        category = Category(**data)
-        db.add(category)
-        await db.commit()
-        await db.refresh(category)
-        return category
+    async def get_existing_ids(category_ids, db: AsyncSession) -> set:
+        result = await db.execute(
+            select(Category.id).where(
+                Category.id.in_(category_ids),
+                Category.is_deleted == False
+            )
+        )
+        return set(result.scalars().all())
     
     @staticmethod
     async def get_by_id(category_id, db: AsyncSession):
@@ -22,39 +35,59 @@ class CategoryRepository:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_all(db: AsyncSession, limit: int, offset: int):
-        total_result = await db.execute(
-            select(func.count()).select_from(Category).where(
-                Category.is_deleted == False
-            )
-        )
-        total = total_result.scalar_one()
+    async def get_all(
+        db: AsyncSession,
+        limit: int,
+        offset: int,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ):
+        query = select(Category).where(Category.is_deleted == False)
+        
+        total = await count_total(query, db, total_mode)
         
         result = await db.execute(
-            select(Category)
-            .where(Category.is_deleted == False)
-            .limit(limit)
+            query
+            .order_by(Category.name)
+            .limit(limit + 1)
             .offset(offset)
         )
         
         items = result.scalars().all()
+        has_more = len(items) > limit
         
-        return total, items
+        return total, items[:limit], has_more
     
-    @staticmethod
-    async def update(category, data: dict, db: AsyncSession):
-        for key, value in data.items():
-            setattr(category, key, value)
-        await db.commit()
-        await db.refresh(category)
+    @classmethod
+    async def create(cls, data: dict, db: AsyncSession):
+        category = await super().create(data, db)
+        await response_cache.invalidate(CATEGORY_LIST_TAG)
         return category
     
-    @staticmethod
-    async def soft_delete(category, db: AsyncSession):
-        category.is_deleted = True
-        await db.commit()
+    @classmethod
+    async def update(cls, category, data: dict, db: AsyncSession):
+        category = await super().update(category, data, db)
+        await response_cache.invalidate(
+            CATEGORY_LIST_TAG,
+            POST_LIST_TAG,
+            category_tag(category.id),
+        )
+        return category
     
-    @staticmethod
-    async def hard_delete(category, db: AsyncSession):
-        await db.delete(category)
-        await db.commit()
\ No newline at end of file
+    @classmethod
+    async def soft_delete(cls, category, db: AsyncSession):
+        await super().soft_delete(category, db)
+        await response_cache.invalidate(
+            CATEGORY_LIST_TAG,
+            POST_LIST_TAG,
+            category_tag(category.id),
+        )
+    
+    @classmethod
+    async def hard_delete(cls, category, db: AsyncSession):
+        category_id = category.id
+        await super().hard_delete(category, db)
+        await response_cache.invalidate(
+            CATEGORY_LIST_TAG,
+            POST_LIST_TAG,
+            category_tag(category_id),
+        )
\ No newline at end of file
@@ -1,16 +1,81 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, delete, and_, func
+from sqlalchemy.orm import joinedload, noload, aliased
+from sqlalchemy.orm.attributes import set_committed_value
+from collections import Counter
+import secrets
+import time
 from app.models.comment import Comment
+from app.models.post import Post
+from app.repositories.base import BaseRepository
+from app.repositories.post import PostRepository
+from app.core.response_cache import (
+    response_cache,
+    POST_LIST_TAG,
+    category_tag,
+    post_tag,
+)
+from app.repositories.counts import count_total
+from app.schemas.pagination import TotalMode
 
-class CommentRepository:
+MAX_THREAD_DEPTH = 32
+
+# Each path segment is a nanosecond timestamp plus a random suffix, both
+# fixed-width hex, so sorting paths (C collation) yields depth-first thread
+# order with siblings oldest first.
+PATH_SEPARATOR = "."
+PATH_UPPER_BOUND = "/"
+
+class CommentRepository(BaseRepository):
+    model = Comment
+    
     @staticmethod
-    async def create(data: dict, db: AsyncSession):
-        comment = Comment(**data)
-        db.add(comment)
+    def thread_position(parent: Comment | None) -> dict:
+        segment = f"{time.time_ns():016x}{secrets.token_hex(4)}"
+        
+        if parent is None:
+            return {"path": segment, "depth": 0}
+        
+        return {
+            "path": f"{parent.path}{PATH_SEPARATOR}{segment}",
+            "depth": parent.depth + 1,
+        }
+    
+    @staticmethod
+    async def get_parents(parent_ids, db: AsyncSession) -> dict:
+        result = await db.execute(
+            select(Comment).where(
+                Comment.id.in_(parent_ids),
+                Comment.is_deleted == False,
+            )
+        )
+        return {comment.id: comment for comment in result.scalars().all()}
+    
+    @classmethod
+    async def create(cls, data: dict, db: AsyncSession):
+        comment = await cls._insert(data, db)
+        category_ids = await PostRepository.adjust_comment_counts(
+            {comment.post_id: 1},
+            db,
+        )
         await db.commit()
-        await db.refresh(comment)
+        await cls._invalidate({comment.post_id}, category_ids)
         return comment
     
+    @classmethod
+    async def bulk_create(cls, rows: list[dict], db: AsyncSession) -> list[Comment]:
+        comments = await cls._bulk_insert(rows, db)
+        category_ids = await PostRepository.adjust_comment_counts(
+            Counter(comment.post_id for comment in comments),
+            db,
+        )
+        await db.commit()
+        await cls._invalidate(
+            {comment.post_id for comment in comments},
+            category_ids,
+        )
+        return comments
+    
     @staticmethod
     async def get_by_id(comment_id, db: AsyncSession):
         result = await db.execute(
@@ -21,46 +86,203 @@ class CommentRepository:
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    def export_query(post_id=None):
+        query = select(Comment).where(Comment.is_deleted == False)
+        
+        if post_id:
+            query = query.where(Comment.post_id == post_id)
+        
+        return query.order_by(Comment.created_at, Comment.id)
+    
     @staticmethod
     async def get_by_post(
         post_id,
         db: AsyncSession,
         limit: int,
         offset: int,
+        total_mode: TotalMode = TotalMode.EXACT,
+        include: set[str] = frozenset(),
     ):
         query = select(Comment).where(
             Comment.post_id == post_id,
             Comment.is_deleted == False
         )
         
-        total = (
-            await db.execute(
-                select(func.count()).select_from(query.subquery())
-            )
-        ).scalar_one()
+        if total_mode == TotalMode.ESTIMATE:
+            total = (
+                await db.execute(
+                    select(Post.comment_count).where(Post.id == post_id)
+                )
+            ).scalar_one_or_none() or 0
+        else:
+            total = await count_total(query, db, total_mode)
         
         result = await db.execute(
-            query.limit(limit).offset(offset)
+            query
+            .options(
+                joinedload(Comment.author) if "author" in include else noload(Comment.author),
+            )
+            .order_by(Comment.created_at, Comment.id)
+            .limit(limit + 1)
+            .offset(offset)
         )
         
         items = result.scalars().all()
+        has_more = len(items) > limit
         
-        return total, items
+        return total, items[:limit], has_more
     
     @staticmethod
-    async def update(comment, data: dict, db: AsyncSession):
-        for key, value in data.items():
-            setattr(comment, key, value)
-        await db.commit()
-        await db.refresh(comment)
-        return comment
+    async def get_threads(
+        post_id,
+        db: AsyncSession,
+        limit: int,
+        offset: int,
+        max_depth: int,
+    ):
+        roots = (
+            select(Comment.path)
+            .where(
+                Comment.post_id == post_id,
+                Comment.depth == 0,
+                Comment.is_deleted == False,
+            )
+            .order_by(Comment.path)
+            .limit(limit + 1)
+            .offset(offset)
+            .cte("roots")
+        )
+        # The extra root only signals has_more; it is counted inside the CTE
+        # and never joined, so its replies are not read.
+        page_roots = (
+            select(roots.c.path)
+            .order_by(roots.c.path)
+            .limit(limit)
+            .cte("page_roots")
+        )
+        has_more = select(func.count()).select_from(roots).scalar_subquery() > limit
+        
+        result = await db.execute(
+            select(Comment, has_more.label("has_more"))
+            .join(
+                page_roots,
+                and_(
+                    Comment.path >= page_roots.c.path,
+                    Comment.path < page_roots.c.path + PATH_UPPER_BOUND,
+                ),
+            )
+            .where(
+                Comment.post_id == post_id,
+                Comment.depth <= max_depth,
+                Comment.is_deleted == False,
+            )
+            .options(noload(Comment.author))
+            .order_by(Comment.path)
+        )
+        
+        rows = result.all()
+        items = [row.Comment for row in rows]
+        has_more = bool(rows) and rows[0].has_more
+        
+        return items, has_more
     
     @staticmethod
-    async def soft_delete(comment, db: AsyncSession):
-        comment.is_deleted = True
+    async def get_subtree(comment_id, db: AsyncSession, max_depth: int):
+        root = aliased(Comment)
+        
+        result = await db.execute(
+            select(Comment)
+            .join(
+                root,
+                and_(
+                    Comment.post_id == root.post_id,
+                    Comment.path >= root.path,
+                    Comment.path < root.path + PATH_UPPER_BOUND,
+                ),
+            )
+            .where(
+                root.id == comment_id,
+                root.is_deleted == False,
+                Comment.depth <= root.depth + max_depth,
+                Comment.is_deleted == False,
+            )
+            .options(noload(Comment.author))
+            .order_by(Comment.path)
+        )
+        return result.scalars().all()
+    
+    @classmethod
+    async def update(cls, comment, data: dict, db: AsyncSession):
+        comment = await super().update(comment, data, db)
+        await response_cache.invalidate(post_tag(comment.post_id))
+        return comment
+    
+    @classmethod
+    async def soft_delete(cls, comment, db: AsyncSession):
+        deleted = await cls._soft_delete(comment, db)
+        category_ids = await PostRepository.adjust_comment_counts(
+            {comment.post_id: -1 if deleted else 0},
+            db,
+        )
+        await db.commit()
+        set_committed_value(comment, "is_deleted", True)
+        await cls._invalidate({comment.post_id}, category_ids)
+    
+    @classmethod
+    async def hard_delete(cls, comment, db: AsyncSession):
+        post_id = comment.post_id
+        
+        # Replies go with their parent, so count every live comment removed.
+        result = await db.execute(
+            delete(Comment)
+            .where(
+                Comment.post_id == post_id,
+                Comment.path >= comment.path,
+                Comment.path < comment.path + PATH_UPPER_BOUND,
+            )
+            .returning(Comment.is_deleted)
+            .execution_options(synchronize_session=False)
+        )
+        removed = sum(1 for is_deleted in result.scalars().all() if not is_deleted)
+        
+        category_ids = await PostRepository.adjust_comment_counts(
+            {post_id: -removed},
+            db,
+        )
         await db.commit()
+        
+        if comment in db:
+            db.expunge(comment)
+        await cls._invalidate({post_id}, category_ids)
+    
+    @staticmethod
+    async def count_live_by_author_subtrees(author_id, db: AsyncSession) -> dict:
+        # Deleting a user cascades to their comments and, through parent_id,
+        # to every reply beneath them; count the live rows that will go.
+        authored = aliased(Comment)
+        result = await db.execute(
+            select(Comment.post_id, func.count(Comment.id.distinct()))
+            .join(
+                authored,
+                and_(
+                    Comment.post_id == authored.post_id,
+                    Comment.path >= authored.path,
+                    Comment.path < authored.path + PATH_UPPER_BOUND,
+                ),
+            )
+            .where(
+                authored.author_id == author_id,
+                Comment.is_deleted == False,
+            )
+            .group_by(Comment.post_id)
+        )
+        return dict(result.all())
     
     @staticmethod
-    async def hard_delete(comment, db: AsyncSession):
-        await db.delete(comment)
-        await db.commit()
\ No newline at end of file
+    async def _invalidate(post_ids: set, category_ids: set):
+        await response_cache.invalidate(
+            POST_LIST_TAG,
+            *(post_tag(post_id) for post_id in post_ids),
+            *(category_tag(category_id) for category_id in category_ids),
+        )
\ No newline at end of file
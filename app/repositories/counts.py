@@ -0,0 +1,74 @@
+import hashlib
+import json
+import logging
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from app.core.config import settings
+from app.core.redis import redis_client
+from app.schemas.pagination import TotalMode
+
+logger = logging.getLogger(__name__)
+
+class Explain(Executable, ClauseElement):
+    inherit_cache = False
+    
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def compile_explain(element: Explain, compiler, **kw):
+    sql = compiler.process(element.statement, **kw)
+    # The plan comes back as a single JSON column; don't map it onto the
+    # explained statement's columns.
+    compiler._result_columns = []
+    return f"EXPLAIN (FORMAT JSON) {sql}"
+
+def count_cache_key(query: Select) -> str:
+    compiled = query.compile(dialect=postgresql.dialect())
+    params = json.dumps(compiled.params, sort_keys=True, default=str)
+    digest = hashlib.sha1(f"{compiled}\n{params}".encode()).hexdigest()
+    return f"count:{digest}"
+
+async def count_total(query: Select, db: AsyncSession, mode: TotalMode) -> int | None:
+    if mode == TotalMode.NONE:
+        return None
+    
+    cache_key = count_cache_key(query)
+    
+    if mode == TotalMode.ESTIMATE:
+        cached = await _get_cached(cache_key)
+        if cached is not None:
+            return cached
+        return await estimate_count(query, db)
+    
+    total = (
+        await db.execute(select(func.count()).select_from(query.subquery()))
+    ).scalar_one()
+    await _set_cached(cache_key, total)
+    return total
+
+async def estimate_count(query: Select, db: AsyncSession) -> int:
+    result = await db.execute(Explain(query))
+    plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+async def _get_cached(key: str) -> int | None:
+    try:
+        value = await redis_client.get(key)
+    except Exception:
+        logger.warning("Count cache read failed", exc_info=True)
+        return None
+    return int(value) if value is not None else None
+
+async def _set_cached(key: str, total: int):
+    try:
+        await redis_client.set(key, total, ex=settings.count_cache_ttl_seconds)
+    except Exception:
+        logger.warning("Count cache write failed", exc_info=True)
@@ -1,16 +1,51 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, update, values, column, tuple_, Integer, Uuid
+from sqlalchemy.orm import joinedload, noload
 from app.models.post import Post
+from app.repositories.base import BaseRepository
+from app.core.pagination import encode_cursor
+from app.services.search import PostSearch
+from app.repositories.counts import count_total
+from app.schemas.pagination import TotalMode
+from app.schemas.post import PostSort
+from app.core.response_cache import (
+    response_cache,
+    POST_LIST_TAG,
+    category_tag,
+    post_tag,
+)
 
-class PostRepository:
-    @staticmethod
-    async def create(data: dict, db: AsyncSession):
-        post = Post(**data)
-        db.add(post)
-        await db.commit()
-        await db.refresh(post)
+class PostRepository(BaseRepository):
+    model = Post
+    
+    @classmethod
+    async def create(cls, data: dict, db: AsyncSession):
+        post = await super().create(data, db)
+        await response_cache.invalidate(
+            POST_LIST_TAG,
+            category_tag(post.category_id),
+        )
         return post
     
+    @classmethod
+    async def bulk_create(cls, rows: list[dict], db: AsyncSession) -> list[Post]:
+        posts = await super().bulk_create(rows, db)
+        await response_cache.invalidate(
+            POST_LIST_TAG,
+            *{category_tag(post.category_id) for post in posts},
+        )
+        return posts
+    
+    @staticmethod
+    async def get_existing_ids(post_ids, db: AsyncSession) -> set:
+        result = await db.execute(
+            select(Post.id).where(
+                Post.id.in_(post_ids),
+                Post.is_deleted == False
+            )
+        )
+        return set(result.scalars().all())
+    
     @staticmethod
     async def get_by_id(post_id, db: AsyncSession):
         result = await db.execute(
@@ -21,6 +56,15 @@ class PostRepository:
         )
         return result.scalar_one_or_none()
     
+    @staticmethod
+    def export_query(category_id=None):
+        query = select(Post).where(Post.is_deleted == False)
+        
+        if category_id:
+            query = query.where(Post.category_id == category_id)
+        
+        return query.order_by(Post.created_at, Post.id)
+    
     @staticmethod
     async def get_all(
         db: AsyncSession,
@@ -28,40 +72,98 @@ class PostRepository:
         offset: int,
         search: str | None = None,
         category_id=None,
+        cursor: tuple | None = None,
+        total_mode: TotalMode = TotalMode.EXACT,
+        include: set[str] = frozenset(),
+        sort: PostSort = PostSort.NEWEST,
     ):
         query = select(Post).where(Post.is_deleted == False)
         
-        if search:
-            query = query.where(Post.title.ilike(f"%{search}%"))
-        
         if category_id:
             query = query.where(Post.category_id == category_id)
         
-        total_query = select(func.count()).select_from(query.subquery())
-        total = (await db.execute(total_query)).scalar_one()
+        if search:
+            query = PostSearch.apply(query, search)
         
-        result = await db.execute(
-            query.limit(limit).offset(offset)
+        total = await count_total(query, db, total_mode)
+        
+        if sort == PostSort.COMMENTS:
+            query = query.order_by(Post.comment_count.desc())
+        
+        query = query.order_by(Post.created_at.desc(), Post.id.desc())
+        
+        keyset = not search and sort == PostSort.NEWEST
+        
+        if cursor and keyset:
+            query = query.where(tuple_(Post.created_at, Post.id) < cursor)
+        else:
+            query = query.offset(offset)
+        
+        query = query.options(
+            joinedload(Post.author) if "author" in include else noload(Post.author),
+            joinedload(Post.category) if "category" in include else noload(Post.category),
         )
         
+        result = await db.execute(query.limit(limit + 1))
+        
         items = result.scalars().all()
         
-        return total, items
+        has_more = len(items) > limit
+        items = items[:limit]
+        
+        next_cursor = None
+        if has_more and keyset:
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+        
+        return total, items, has_more, next_cursor
     
     @staticmethod
-    async def update(post, data: dict, db: AsyncSession):
-        for key, value in data.items():
-            setattr(post, key, value)
-        await db.commit()
-        await db.refresh(post)
+    async def adjust_comment_counts(deltas: dict, db: AsyncSession) -> set:
+        deltas = {post_id: delta for post_id, delta in deltas.items() if delta}
+        if not deltas:
+            return set()
+        
+        changes = values(
+            column("post_id", Uuid),
+            column("delta", Integer),
+            name="changes",
+        ).data(list(deltas.items()))
+        
+        result = await db.execute(
+            update(Post)
+            .where(Post.id == changes.c.post_id)
+            .values(comment_count=Post.comment_count + changes.c.delta)
+            .returning(Post.category_id)
+            .execution_options(synchronize_session=False)
+        )
+        return set(result.scalars().all())
+    
+    @classmethod
+    async def update(cls, post, data: dict, db: AsyncSession):
+        previous_category_id = post.category_id
+        post = await super().update(post, data, db)
+        await response_cache.invalidate(
+            POST_LIST_TAG,
+            category_tag(previous_category_id),
+            category_tag(post.category_id),
+        )
         return post
     
-    @staticmethod
-    async def soft_delete(post, db: AsyncSession):
-        post.is_deleted = True
-        await db.commit()
+    @classmethod
+    async def soft_delete(cls, post, db: AsyncSession):
+        await super().soft_delete(post, db)
+        await response_cache.invalidate(
+            POST_LIST_TAG,
+            category_tag(post.category_id),
+            post_tag(post.id),
+        )
     
-    @staticmethod
-    async def hard_delete(post, db: AsyncSession):
-        await db.delete(post)
-        await db.commit()
\ No newline at end of file
+    @classmethod
+    async def hard_delete(cls, post, db: AsyncSession):
+        post_id, category_id = post.id, post.category_id
+        await super().hard_delete(post, db)
+        await response_cache.invalidate(
+            POST_LIST_TAG,
+            category_tag(category_id),
+            post_tag(post_id),
+        )
\ No newline at end of file
@@ -1,16 +1,18 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select
 from app.models.user import User
+from app.models.post import Post
+from app.repositories.base import BaseRepository
+from app.repositories.post import PostRepository
+from app.repositories.comment import CommentRepository
 from app.core.roles import UserRole
+from app.core.principal_cache import principal_cache
+from app.core.response_cache import response_cache, AUTHOR_TAG
+from app.repositories.counts import count_total
+from app.schemas.pagination import TotalMode
 
-class UserRepository:
-    @staticmethod
-    async def create(data: dict, db: AsyncSession) -> User:
-        user = User(**data)
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        return user
+class UserRepository(BaseRepository):
+    model = User
     
     @staticmethod
     async def get_by_id(user_id, db: AsyncSession):
@@ -23,41 +25,72 @@ class UserRepository:
         return result.scalar_one_or_none()
     
     @staticmethod
-    async def get_all(db: AsyncSession, limit: int, offset: int):
-        total = (
-            await db.execute(
-                select(func.count()).select_from(User).where(
-                    User.is_deleted == False
-                )
-            )
-        ).scalar_one()
-        
-        result = await db.execute(
+    def export_query():
+        return (
             select(User)
             .where(User.is_deleted == False)
-            .limit(limit)
+            .order_by(User.created_at, User.id)
+        )
+    
+    @staticmethod
+    async def get_all(
+        db: AsyncSession,
+        limit: int,
+        offset: int,
+        total_mode: TotalMode = TotalMode.EXACT,
+    ):
+        query = select(User).where(User.is_deleted == False)
+        
+        total = await count_total(query, db, total_mode)
+        
+        result = await db.execute(
+            query
+            .order_by(User.created_at, User.id)
+            .limit(limit + 1)
             .offset(offset)
         )
         
         items = result.scalars().all()
-        return total, items
+        has_more = len(items) > limit
+        return total, items[:limit], has_more
     
-    @staticmethod
-    async def update(user: User, data: dict, db: AsyncSession):
-        for key, value in data.items():
-            setattr(user, key, value)
-        
-        await db.commit()
-        await db.refresh(user)
+    @classmethod
+    async def update(cls, user: User, data: dict, db: AsyncSession):
+        user = await super().update(user, data, db)
+        await principal_cache.invalidate(user.id)
+        # Embedded authors only carry the display name.
+        if "display_name" in data:
+            await response_cache.invalidate(AUTHOR_TAG)
         return user
     
-    @staticmethod
-    async def soft_delete(user: User, db: AsyncSession):
-        user.is_deleted = True
-        user.is_active = False
-        await db.commit()
+    @classmethod
+    async def soft_delete(cls, user: User, db: AsyncSession):
+        await super().update(
+            user,
+            {"is_deleted": True, "is_active": False},
+            db,
+        )
+        await principal_cache.invalidate(user.id)
     
-    @staticmethod
-    async def hard_delete(user: User, db: AsyncSession):
-        await db.delete(user)
-        await db.commit()
\ No newline at end of file
+    @classmethod
+    async def hard_delete(cls, user: User, db: AsyncSession):
+        user_id = user.id
+        
+        # The user's posts go with them through author_id's ON DELETE CASCADE.
+        result = await db.execute(
+            select(Post.id, Post.category_id).where(Post.author_id == user_id)
+        )
+        own_posts = result.all()
+        
+        removed = await CommentRepository.count_live_by_author_subtrees(user_id, db)
+        category_ids = await PostRepository.adjust_comment_counts(
+            {post_id: -count for post_id, count in removed.items()},
+            db,
+        )
+        await super().hard_delete(user, db)
+        
+        await principal_cache.invalidate(user_id)
+        await CommentRepository._invalidate(
+            set(removed) | {post_id for post_id, _ in own_posts},
+            category_ids | {category_id for _, category_id in own_posts},
+        )
\ No newline at end of file
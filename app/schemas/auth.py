@@ -1,4 +1,6 @@
 from pydantic import BaseModel
+from uuid import UUID
+from app.core.roles import UserRole
 
 class TokenPair(BaseModel):
     access_token: str
@@ -6,4 +8,12 @@ class TokenPair(BaseModel):
     token_type: str = "bearer"
 
 class TokenRefresh(BaseModel):
-    refresh_token: str
\ No newline at end of file
+    refresh_token: str
+
+class Principal(BaseModel):
+    id: UUID
+    role: UserRole
+    is_active: bool
+    is_deleted: bool
+    
+    model_config = {"from_attributes": True}
\ No newline at end of file
@@ -16,4 +16,10 @@ class CategoryRead(BaseModel):
     
     model_config = {
         "from_attributes": True,
-    }
\ No newline at end of file
+    }
+
+class CategorySummary(BaseModel):
+    id: UUID
+    name: str
+    
+    model_config = {"from_attributes": True}
\ No newline at end of file
@@ -1,9 +1,11 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
+from app.schemas.user import AuthorRead
 
 class CommentCreate(BaseModel):
     content: str
     post_id: UUID
+    parent_id: UUID | None = None
 
 class CommentUpdate(BaseModel):
     content: str | None = None
@@ -13,5 +15,19 @@ class CommentRead(BaseModel):
     content: str
     post_id: UUID
     author_id: UUID
+    parent_id: UUID | None = None
+    depth: int = 0
     
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+class CommentExpandedRead(CommentRead):
+    author: AuthorRead | None = None
+
+class CommentBulkCreate(BaseModel):
+    items: list[CommentCreate] = Field(min_length=1, max_length=200)
+
+class CommentBulkResult(BaseModel):
+    index: int
+    status: str
+    item: CommentRead | None = None
+    error: str | None = None
\ No newline at end of file
@@ -1,10 +1,19 @@
 from pydantic import BaseModel
 from typing import Generic, TypeVar, List
+from enum import StrEnum
 
 T = TypeVar("T")
 
+class TotalMode(StrEnum):
+    EXACT = "exact"
+    ESTIMATE = "estimate"
+    NONE = "none"
+
 class Page(BaseModel, Generic[T]):
-    total: int
+    total: int | None
     limit: int
     offset: int
-    items: List[T]
\ No newline at end of file
+    items: List[T]
+    next_cursor: str | None = None
+    total_mode: TotalMode = TotalMode.EXACT
+    has_more: bool = False
@@ -1,5 +1,12 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from uuid import UUID
+from enum import StrEnum
+from app.schemas.user import AuthorRead
+from app.schemas.category import CategorySummary
+
+class PostSort(StrEnum):
+    NEWEST = "newest"
+    COMMENTS = "comments"
 
 class PostCreate(BaseModel):
     title: str
@@ -17,5 +24,19 @@ class PostRead(BaseModel):
     content: str
     author_id: UUID
     category_id: UUID
+    comment_count: int = 0
     
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+class PostExpandedRead(PostRead):
+    author: AuthorRead | None = None
+    category: CategorySummary | None = None
+
+class PostBulkCreate(BaseModel):
+    items: list[PostCreate] = Field(min_length=1, max_length=100)
+
+class PostBulkResult(BaseModel):
+    index: int
+    status: str
+    item: PostRead | None = None
+    error: str | None = None
\ No newline at end of file
@@ -1,14 +1,24 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
 from app.core.roles import UserRole
 
+DISPLAY_NAME_MAX_LENGTH = 50
+
 class UserCreate(BaseModel):
     email: EmailStr
     password: str
+    display_name: str | None = Field(default=None, max_length=DISPLAY_NAME_MAX_LENGTH)
 
 class UserRead(BaseModel):
     id: UUID
     email: EmailStr
+    display_name: str | None = None
     role: UserRole
     
     model_config = {"from_attributes": True}
+
+class AuthorRead(BaseModel):
+    id: UUID
+    display_name: str | None = None
+    
+    model_config = {"from_attributes": True}
\ No newline at end of file
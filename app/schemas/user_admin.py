@@ -1,12 +1,15 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from uuid import UUID
 from app.core.roles import UserRole
+from app.schemas.user import DISPLAY_NAME_MAX_LENGTH
 
 class UserUpdateAdmin(BaseModel):
     role: UserRole | None = None
     is_active: bool | None = None
+    display_name: str | None = Field(default=None, max_length=DISPLAY_NAME_MAX_LENGTH)
 
 class UserCreateAdmin(BaseModel):
     email: EmailStr
     password: str
+    display_name: str | None = Field(default=None, max_length=DISPLAY_NAME_MAX_LENGTH)
     role: UserRole = UserRole.ADMIN
\ No newline at end of file
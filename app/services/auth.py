@@ -3,9 +3,10 @@ from sqlalchemy import select
 from fastapi import HTTPException, status
 
 from app.models.user import User
+from app.repositories.user import UserRepository
 from app.core.security import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     decode_token,
@@ -15,7 +16,12 @@ from app.core.roles import UserRole
 
 class AuthService:
     @staticmethod
-    async def register(email: str, password: str, db: AsyncSession) -> User:
+    async def register(
+        email: str,
+        password: str,
+        db: AsyncSession,
+        display_name: str | None = None,
+    ) -> User:
         result = await db.execute(select(User).where(User.email == email))
         existing = result.scalar_one_or_none()
         
@@ -25,24 +31,22 @@ class AuthService:
                 detail="Email already registered",
             )
         
-        user = User(
-            email=email,
-            hashed_password=hash_password(password),
-            role=UserRole.USER,
+        return await UserRepository.create(
+            {
+                "email": email,
+                "display_name": display_name,
+                "hashed_password": await hash_password_async(password),
+                "role": UserRole.USER,
+            },
+            db,
         )
-        
-        db.add(user)
-        await db.commit()
-        await db.refresh(user)
-        
-        return user
     
     @staticmethod
     async def login(email: str, password: str, db: AsyncSession) -> TokenPair:
         result = await db.execute(select(User).where(User.email == email))
         user = result.scalar_one_or_none()
         
-        if not user or not verify_password(password, user.hashed_password):
+        if not user or not await verify_password_async(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
@@ -0,0 +1,65 @@
+import csv
+import io
+from enum import StrEnum
+from typing import AsyncIterator
+
+from fastapi import Request
+from pydantic import BaseModel
+from sqlalchemy import Select
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+
+class ExportFormat(StrEnum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+class ExportService:
+    @staticmethod
+    def headers(name: str, export_format: ExportFormat) -> dict:
+        return {
+            "Content-Disposition": f'attachment; filename="{name}.{export_format}"',
+        }
+    
+    @staticmethod
+    async def stream(
+        request: Request,
+        query: Select,
+        schema: type[BaseModel],
+        export_format: ExportFormat,
+    ) -> AsyncIterator[str]:
+        chunk_size = settings.export_chunk_size
+        if export_format == ExportFormat.CSV:
+            yield ExportService._csv_rows([list(schema.model_fields)])
+        
+        async with AsyncSessionLocal() as db:
+            result = await db.stream_scalars(
+                query.execution_options(yield_per=chunk_size)
+            )
+            
+            async for partition in result.partitions():
+                if await request.is_disconnected():
+                    break
+                
+                items = [schema.model_validate(row) for row in partition]
+                
+                if export_format == ExportFormat.CSV:
+                    yield ExportService._csv_rows([
+                        list(item.model_dump(mode="json").values())
+                        for item in items
+                    ])
+                else:
+                    yield "".join(item.model_dump_json() + "\n" for item in items)
+            
+            await result.close()
+    
+    @staticmethod
+    def _csv_rows(rows: list[list]) -> str:
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        return buffer.getvalue()
@@ -0,0 +1,74 @@
+import asyncio
+import time
+
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.database import engine
+from app.core.redis import redis_client
+
+class HealthService:
+    def __init__(self, ttl_seconds: float, timeout_seconds: float):
+        self.ttl = ttl_seconds
+        self.timeout = timeout_seconds
+        self._result: dict | None = None
+        self._checked_at = 0.0
+        self._running: asyncio.Task | None = None
+    
+    async def check(self) -> dict:
+        if self._result is not None and time.monotonic() - self._checked_at < self.ttl:
+            return self._result
+        
+        # Concurrent probes share one in-flight check instead of each
+        # taking a connection from the pool.
+        if self._running is None:
+            self._running = asyncio.create_task(self._run())
+            self._running.add_done_callback(self._finish)
+        
+        return await asyncio.shield(self._running)
+    
+    def _finish(self, task: asyncio.Task):
+        self._running = None
+        if not task.cancelled() and task.exception() is None:
+            self._result = task.result()
+            self._checked_at = time.monotonic()
+    
+    async def _run(self) -> dict:
+        database, redis = await asyncio.gather(
+            self._timed(self._check_database()),
+            self._timed(self._check_redis()),
+        )
+        return {
+            "status": "ok" if database["status"] == redis["status"] == "ok" else "error",
+            "checks": {
+                "database": database,
+                "redis": redis,
+            },
+        }
+    
+    async def _timed(self, probe) -> dict:
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(probe, timeout=self.timeout)
+            status = {"status": "ok"}
+        except asyncio.TimeoutError:
+            status = {"status": "error", "error": "timeout"}
+        except Exception as exc:
+            status = {"status": "error", "error": type(exc).__name__}
+        
+        status["latency_ms"] = round((time.perf_counter() - started) * 1000, 2)
+        return status
+    
+    @staticmethod
+    async def _check_database():
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    
+    @staticmethod
+    async def _check_redis():
+        await redis_client.ping()
+
+health_service = HealthService(
+    ttl_seconds=settings.health_check_cache_ttl_seconds,
+    timeout_seconds=settings.health_check_timeout_seconds,
+)
@@ -0,0 +1,20 @@
+from sqlalchemy import Select, func
+from app.models.post import Post
+
+SEARCH_CONFIG = "english"
+
+class PostSearch:
+    @staticmethod
+    def ts_query(term: str):
+        return func.websearch_to_tsquery(SEARCH_CONFIG, term)
+    
+    @staticmethod
+    def apply(query: Select, term: str) -> Select:
+        ts_query = PostSearch.ts_query(term)
+        rank = func.ts_rank_cd(Post.search_vector, ts_query)
+        
+        return (
+            query
+            .where(Post.search_vector.op("@@")(ts_query))
+            .order_by(rank.desc())
+        )
@@ -0,0 +1,70 @@
+"""Cold start to first request: spawns uvicorn and times the first responses.
+
+Uses the database and Redis configured in .env. Set ADMIN_PASSWORD_HASH to
+see startup without the bcrypt hash on a fresh database:
+
+    python -m benchmarks.cold_start --runs 5
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+
+def wait_until_ready(client: httpx.Client, timeout: float) -> float | None:
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            if client.get("/health/live").status_code == 200:
+                return time.perf_counter()
+        except httpx.TransportError:
+            pass
+        time.sleep(0.01)
+    return None
+
+def run_once(port: int, timeout: float) -> dict:
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+    )
+    
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=timeout) as client:
+            ready = wait_until_ready(client, timeout)
+            if ready is None:
+                return {"error": "server did not become ready"}
+            
+            first_request_started = time.perf_counter()
+            client.get("/posts/")
+            first_request_done = time.perf_counter()
+    finally:
+        server.terminate()
+        server.wait()
+    
+    return {
+        "ready_ms": round((ready - started) * 1000, 1),
+        "first_request_ms": round((first_request_done - first_request_started) * 1000, 1),
+        "cold_start_to_first_request_ms": round((first_request_done - started) * 1000, 1),
+    }
+
+def main(runs: int, port: int, timeout: float):
+    results = [run_once(port, timeout) for _ in range(runs)]
+    completed = [result for result in results if "error" not in result]
+    
+    summary = {
+        key: round(statistics.median(result[key] for result in completed), 1)
+        for key in ("ready_ms", "first_request_ms", "cold_start_to_first_request_ms")
+    } if completed else {}
+    
+    print(json.dumps({"runs": results, "median": summary}, indent=2))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--timeout", type=float, default=30)
+    args = parser.parse_args()
+    main(args.runs, args.port, args.timeout)
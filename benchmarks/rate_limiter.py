@@ -0,0 +1,84 @@
+"""Per-check latency of the global limiter: Redis mode vs hybrid mode.
+
+Runs against the Redis configured in .env. Hybrid checks are served from
+worker memory while a background task flushes counts in batches:
+
+    python -m benchmarks.rate_limiter --checks 5000 --clients 50
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from types import SimpleNamespace
+
+from app.core.redis import redis_client
+from app.core.rate_limiter import RateLimiter, RateLimitAlgorithm, RateLimitMode
+
+def fake_request(client_id: int):
+    return SimpleNamespace(
+        headers={},
+        client=SimpleNamespace(host=f"10.0.{client_id // 256}.{client_id % 256}"),
+        state=SimpleNamespace(),
+    )
+
+async def run(mode: RateLimitMode, checks: int, clients: int, concurrency: int) -> dict:
+    limiter = RateLimiter(
+        limit=checks,
+        window_seconds=60,
+        name=f"bench-{mode}",
+        algorithm=RateLimitAlgorithm.SLIDING_WINDOW,
+        mode=mode,
+    )
+    requests = [fake_request(client_id) for client_id in range(clients)]
+    durations = []
+    remaining = iter(range(checks))
+    
+    async def worker():
+        for _ in remaining:
+            request = random.choice(requests)
+            started = time.perf_counter()
+            await limiter.check(request)
+            durations.append(time.perf_counter() - started)
+    
+    sync_task = None
+    if mode == RateLimitMode.HYBRID:
+        sync_task = asyncio.create_task(limiter.run_sync())
+    
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    
+    if sync_task:
+        sync_task.cancel()
+        await asyncio.gather(sync_task, return_exceptions=True)
+        await limiter.sync()
+    
+    durations.sort()
+    return {
+        "checks": checks,
+        "checks_per_second": round(checks / elapsed, 1),
+        "mean_us": round(sum(durations) / checks * 1_000_000, 1),
+        "p50_us": round(durations[checks // 2] * 1_000_000, 1),
+        "p99_us": round(durations[int(checks * 0.99) - 1] * 1_000_000, 1),
+    }
+
+async def main(checks: int, clients: int, concurrency: int):
+    results = {
+        mode: await run(mode, checks, clients, concurrency)
+        for mode in RateLimitMode
+    }
+    
+    keys = [key async for key in redis_client.scan_iter("rate:bench-*")]
+    if keys:
+        await redis_client.delete(*keys)
+    
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--checks", type=int, default=5000)
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(main(args.checks, args.clients, args.concurrency))
@@ -0,0 +1,93 @@
+"""Round trips and latency per write: legacy ORM pattern vs BaseRepository.
+
+Run against the database configured in .env:
+
+    python -m benchmarks.repository_writes --iterations 200
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+
+from sqlalchemy import event
+
+from app.core.database import engine, AsyncSessionLocal
+from app.models.category import Category
+from app.repositories.category import CategoryRepository
+
+class RoundTripCounter:
+    def __init__(self):
+        self.count = 0
+    
+    def __enter__(self):
+        event.listen(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+        return self
+    
+    def __exit__(self, *exc):
+        event.remove(engine.sync_engine, "before_cursor_execute", self._on_execute)
+        event.remove(engine.sync_engine, "commit", self._on_commit)
+    
+    def _on_execute(self, *args):
+        self.count += 1
+    
+    def _on_commit(self, *args):
+        self.count += 1
+
+async def legacy_write(db, name: str):
+    category = Category(name=name, description="legacy")
+    db.add(category)
+    await db.commit()
+    await db.refresh(category)
+    
+    category.description = "legacy updated"
+    await db.commit()
+    await db.refresh(category)
+    
+    await db.delete(category)
+    await db.commit()
+
+async def repository_write(db, name: str):
+    category = await CategoryRepository.create(
+        {"name": name, "description": "repository"},
+        db,
+    )
+    category = await CategoryRepository.update(
+        category,
+        {"description": "repository updated"},
+        db,
+    )
+    await CategoryRepository.hard_delete(category, db)
+
+async def run(scenario, iterations: int) -> dict:
+    durations = []
+    
+    with RoundTripCounter() as counter:
+        async with AsyncSessionLocal() as db:
+            for _ in range(iterations):
+                started = time.perf_counter()
+                await scenario(db, f"bench-{uuid.uuid4()}")
+                durations.append(time.perf_counter() - started)
+    
+    durations.sort()
+    return {
+        "iterations": iterations,
+        "round_trips_per_write_cycle": counter.count / iterations,
+        "mean_ms": sum(durations) / iterations * 1000,
+        "p95_ms": durations[int(iterations * 0.95) - 1] * 1000,
+    }
+
+async def main(iterations: int):
+    results = {
+        "legacy": await run(legacy_write, iterations),
+        "repository": await run(repository_write, iterations),
+    }
+    await engine.dispose()
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
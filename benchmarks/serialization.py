@@ -0,0 +1,107 @@
+"""Serialization CPU per page: stdlib JSONResponse vs the response_model path vs model_dump_json.
+
+Builds an in-memory Page[PostRead] (no database needed) and renders it the
+way each response path does (routes with a response_model are serialized
+straight to JSON bytes by pydantic), then reports gzip/brotli cost and size:
+
+    python -m benchmarks.serialization --items 100 --content-size 4000
+"""
+import argparse
+import json
+import time
+import uuid
+import zlib
+from types import SimpleNamespace
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.schemas.pagination import Page
+from app.schemas.post import PostRead
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+def make_rows(items: int, content_size: int) -> list:
+    content = ("lorem ipsum dolor sit amet " * (content_size // 27 + 1))[:content_size]
+    return [
+        SimpleNamespace(
+            id=uuid.uuid4(),
+            title=f"Post {index}",
+            content=content,
+            author_id=uuid.uuid4(),
+            category_id=uuid.uuid4(),
+            comment_count=index,
+        )
+        for index in range(items)
+    ]
+
+def build_page(rows: list) -> Page[PostRead]:
+    return Page[PostRead](
+        total=len(rows),
+        limit=len(rows),
+        offset=0,
+        items=[PostRead.model_validate(row) for row in rows],
+    )
+
+def stdlib_response(rows: list) -> bytes:
+    return JSONResponse(jsonable_encoder(build_page(rows))).body
+
+page_adapter = TypeAdapter(Page[PostRead])
+
+def response_model_json(rows: list) -> bytes:
+    return page_adapter.dump_json(build_page(rows))
+
+def pydantic_json(rows: list) -> bytes:
+    return build_page(rows).model_dump_json().encode()
+
+def gzip_body(body: bytes) -> bytes:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    return compressor.compress(body) + compressor.flush()
+
+def brotli_body(body: bytes) -> bytes:
+    return brotli.compress(body, quality=4)
+
+def measure(render, payload, iterations: int) -> dict:
+    started = time.process_time()
+    for _ in range(iterations):
+        body = render(payload)
+    elapsed = time.process_time() - started
+    
+    return {
+        "cpu_ms_per_page": elapsed / iterations * 1000,
+        "bytes": len(body),
+    }
+
+def main(items: int, content_size: int, iterations: int):
+    rows = make_rows(items, content_size)
+    body = response_model_json(rows)
+    
+    results = {
+        "items": items,
+        "content_size": content_size,
+        "serialization": {
+            "stdlib": measure(stdlib_response, rows, iterations),
+            "response_model": measure(response_model_json, rows, iterations),
+            "model_dump_json": measure(pydantic_json, rows, iterations),
+        },
+        "compression": {
+            "gzip": measure(gzip_body, body, iterations),
+        },
+    }
+    
+    if brotli is not None:
+        results["compression"]["br"] = measure(brotli_body, body, iterations)
+    
+    print(json.dumps(results, indent=2))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--content-size", type=int, default=4000)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main(args.items, args.content_size, args.iterations)
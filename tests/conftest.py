@@ -5,7 +5,7 @@ from sqlalchemy import text
 from fastapi import Request
 
 from app.main import app
-from app.core.database import Base, get_db
+from app.core.database import Base, get_db, get_read_db
 from app.core.config import settings
 
 TEST_DB_NAME = settings.postgres_db + "_test"
@@ -88,6 +88,7 @@ async def client(db):
         yield db
     
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     transport = ASGITransport(app=app)
     
@@ -100,5 +101,10 @@ async def client(db):
 async def override_rate_limiter(monkeypatch):
     async def fake_rate_limiter(request):
         return
-    from app.core.rate_limiter import RateLimiter
+    
+    async def fake_check(self, request, cost=1):
+        return RateLimitResult(limit=self.limit, remaining=self.limit, retry_after=0)
+    
+    from app.core.rate_limiter import RateLimiter, RateLimitResult
     monkeypatch.setattr(RateLimiter, "__call__", fake_rate_limiter)
+    monkeypatch.setattr(RateLimiter, "check", fake_check)
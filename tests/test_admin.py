@@ -21,4 +21,137 @@ async def test_admin_create_category(client):
         headers={"Authorization": f"Bearer {token}"},
     )
     
-    assert response.status_code == 200
\ No newline at end of file
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_hard_delete_user_updates_comment_counts(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    admin_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "CascadeCat",
+            "description": "Desc",
+        },
+        headers=admin_headers,
+    )
+    post_response = await client.post(
+        "/posts/",
+        json={
+            "title": "Cascade Post",
+            "content": "Content",
+            "category_id": category_response.json()["id"],
+        },
+        headers=admin_headers,
+    )
+    post_id = post_response.json()["id"]
+    
+    register = await client.post(
+        "/auth/register",
+        json={
+            "email": "commenter@test.com",
+            "password": "password123",
+        },
+    )
+    user_id = register.json()["id"]
+    user_login = await client.post(
+        "/auth/login",
+        data={
+            "username": "commenter@test.com",
+            "password": "password123",
+        },
+    )
+    user_headers = {"Authorization": f"Bearer {user_login.json()['access_token']}"}
+    
+    comment = await client.post(
+        "/comments/",
+        json={"content": "By commenter", "post_id": post_id},
+        headers=user_headers,
+    )
+    await client.post(
+        "/comments/",
+        json={
+            "content": "Admin reply",
+            "post_id": post_id,
+            "parent_id": comment.json()["id"],
+        },
+        headers=admin_headers,
+    )
+    await client.post(
+        "/comments/",
+        json={"content": "Admin comment", "post_id": post_id},
+        headers=admin_headers,
+    )
+    
+    before = await client.get(f"/posts/{post_id}")
+    assert before.json()["comment_count"] == 3
+    
+    response = await client.delete(f"/users/{user_id}/hard", headers=admin_headers)
+    assert response.status_code == 200
+    
+    after = await client.get(f"/posts/{post_id}")
+    assert after.json()["comment_count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hard_delete_user_invalidates_their_posts(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    admin_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "AuthorGoneCat",
+            "description": "Desc",
+        },
+        headers=admin_headers,
+    )
+    category_id = category_response.json()["id"]
+    
+    register = await client.post(
+        "/auth/register",
+        json={
+            "email": "author@test.com",
+            "password": "password123",
+        },
+    )
+    user_login = await client.post(
+        "/auth/login",
+        data={
+            "username": "author@test.com",
+            "password": "password123",
+        },
+    )
+    await client.post(
+        "/posts/",
+        json={
+            "title": "Soon Gone",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {user_login.json()['access_token']}"},
+    )
+    
+    url = f"/posts/?category_id={category_id}"
+    listing = await client.get(url)
+    assert len(listing.json()["items"]) == 1
+    etag = listing.headers["etag"]
+    
+    await client.delete(f"/users/{register.json()['id']}/hard", headers=admin_headers)
+    
+    after = await client.get(url, headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.json()["items"] == []
@@ -1,4 +1,12 @@
+import asyncio
+import threading
+
 import pytest
+from fastapi import HTTPException
+from jose import JWTError
+
+from app.core import security
+from app.core.security import PasswordHasher, VerifiedTokenCache, create_access_token
 
 @pytest.mark.asyncio
 async def test_register_and_login(client):
@@ -21,4 +29,64 @@ async def test_register_and_login(client):
     
     assert login.status_code == 200
     tokens = login.json()
-    assert "access_token" in tokens
\ No newline at end of file
+    assert "access_token" in tokens
+
+
+def test_verified_token_cache_honours_exp(monkeypatch):
+    cache = VerifiedTokenCache(max_size=1)
+    token = create_access_token({"sub": "user-id"})
+    
+    payload = cache.verify(token)
+    assert payload["sub"] == "user-id"
+    assert cache.verify(token)["sub"] == "user-id"
+    assert cache.stats() == {"size": 1, "hits": 1, "misses": 1}
+    
+    with pytest.raises(TypeError):
+        payload["exp"] = 0
+    
+    monkeypatch.setattr(security.time, "time", lambda: payload["exp"] + 1)
+    assert cache.verify(token)["sub"] == "user-id"
+    assert cache.stats()["misses"] == 2
+    
+    with pytest.raises(JWTError):
+        cache.verify(token.replace(".", "x.", 1))
+    assert cache.stats()["misses"] == 3
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_round_trip():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    
+    hashed = await hasher.hash("password123")
+    
+    assert await hasher.verify("password123", hashed)
+    assert not await hasher.verify("wrong", hashed)
+    assert hasher.stats() == {"workers": 1, "in_flight": 0, "queued": 0, "rejected": 0}
+
+
+@pytest.mark.asyncio
+async def test_password_hasher_fails_fast_when_queue_is_full():
+    hasher = PasswordHasher(workers=1, queue_limit=1)
+    started = threading.Event()
+    release = threading.Event()
+    
+    def block():
+        started.set()
+        release.wait(5)
+        return "done"
+    
+    running = asyncio.ensure_future(hasher._submit(block))
+    await asyncio.to_thread(started.wait, 5)
+    queued = asyncio.ensure_future(hasher._submit(lambda: "queued"))
+    await asyncio.sleep(0)
+    assert hasher.stats() == {"workers": 1, "in_flight": 1, "queued": 1, "rejected": 0}
+    
+    with pytest.raises(HTTPException) as exc_info:
+        await hasher._submit(block)
+    assert exc_info.value.status_code == 503
+    assert hasher.stats()["rejected"] == 1
+    
+    release.set()
+    assert await running == "done"
+    assert await queued == "queued"
+    assert hasher.stats() == {"workers": 1, "in_flight": 0, "queued": 0, "rejected": 1}
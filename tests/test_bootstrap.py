@@ -0,0 +1,39 @@
+import pytest
+from pydantic import ValidationError
+from sqlalchemy import select, func
+
+from app.core.bootstrap import bootstrap
+from app.core.config import Settings, settings
+from app.core.roles import UserRole
+from app.models.category import Category
+from app.models.user import User
+
+@pytest.mark.asyncio
+async def test_bootstrap_is_idempotent(db):
+    await bootstrap(db)
+    await bootstrap(db)
+    
+    admins = await db.scalar(
+        select(func.count()).select_from(User).where(User.role == UserRole.ADMIN)
+    )
+    categories = await db.scalar(
+        select(func.count()).select_from(Category).where(Category.name == "General")
+    )
+    
+    assert admins == 1
+    assert categories == 1
+
+@pytest.mark.parametrize(
+    "password, password_hash",
+    [
+        ("", ""),
+        ("admin123", "$2b$12$" + "a" * 53),
+        ("", "not-a-bcrypt-hash"),
+    ],
+)
+def test_settings_reject_invalid_admin_credentials(password, password_hash):
+    values = settings.model_dump(by_alias=True)
+    values.update(ADMIN_PASSWORD=password, ADMIN_PASSWORD_HASH=password_hash)
+    
+    with pytest.raises(ValidationError):
+        Settings(**values)
@@ -0,0 +1,135 @@
+import pytest
+from uuid import UUID
+
+from app.repositories.comment import CommentRepository
+
+@pytest.mark.asyncio
+async def test_comment_threads(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "ThreadCat",
+            "description": "Desc",
+        },
+        headers=headers,
+    )
+    category_id = category_response.json()["id"]
+    
+    post_response = await client.post(
+        "/posts/",
+        json={
+            "title": "Thread Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers=headers,
+    )
+    post_id = post_response.json()["id"]
+    
+    root = await client.post(
+        "/comments/",
+        json={"content": "Root", "post_id": post_id},
+        headers=headers,
+    )
+    root_id = root.json()["id"]
+    
+    reply = await client.post(
+        "/comments/",
+        json={"content": "Reply", "post_id": post_id, "parent_id": root_id},
+        headers=headers,
+    )
+    assert reply.status_code == 200
+    assert reply.json()["depth"] == 1
+    
+    await client.post(
+        "/comments/",
+        json={
+            "content": "Nested",
+            "post_id": post_id,
+            "parent_id": reply.json()["id"],
+        },
+        headers=headers,
+    )
+    await client.post(
+        "/comments/",
+        json={"content": "Second root", "post_id": post_id},
+        headers=headers,
+    )
+    
+    threads = await client.get(
+        f"/comments/post/{post_id}/threads",
+        params={"limit": 1},
+    )
+    assert threads.status_code == 200
+    page = threads.json()
+    assert [item["content"] for item in page["items"]] == ["Root", "Reply", "Nested"]
+    assert page["has_more"] is True
+    
+    subtree = await client.get(
+        f"/comments/{root_id}/thread",
+        params={"max_depth": 1},
+    )
+    assert subtree.status_code == 200
+    assert [item["content"] for item in subtree.json()] == ["Root", "Reply"]
+
+
+@pytest.mark.asyncio
+async def test_repeated_soft_delete_decrements_once(client, db):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "DeleteTwiceCat",
+            "description": "Desc",
+        },
+        headers=headers,
+    )
+    post_response = await client.post(
+        "/posts/",
+        json={
+            "title": "Delete Twice",
+            "content": "Content",
+            "category_id": category_response.json()["id"],
+        },
+        headers=headers,
+    )
+    post_id = post_response.json()["id"]
+    
+    for i in range(2):
+        await client.post(
+            "/comments/",
+            json={
+                "content": f"Comment {i}",
+                "post_id": post_id,
+            },
+            headers=headers,
+        )
+    
+    comments = await client.get(f"/comments/post/{post_id}")
+    comment_id = comments.json()["items"][0]["id"]
+    comment = await CommentRepository.get_by_id(UUID(comment_id), db)
+    
+    await CommentRepository.soft_delete(comment, db)
+    await CommentRepository.soft_delete(comment, db)
+    
+    post = await client.get(f"/posts/{post_id}")
+    assert post.json()["comment_count"] == 1
@@ -0,0 +1,194 @@
+import csv
+import io
+import json
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+import app.services.export as export_module
+from app.core.config import settings
+from app.repositories.post import PostRepository
+from app.schemas.comment import CommentRead
+from app.schemas.post import PostRead
+from app.schemas.user import UserRead
+from app.services.export import ExportFormat, ExportService
+
+class ConnectedRequest:
+    async def is_disconnected(self):
+        return False
+
+@pytest.fixture(autouse=True)
+def export_session(db, monkeypatch):
+    # Exports open their own session outside get_db; point it at the test database.
+    monkeypatch.setattr(
+        export_module,
+        "AsyncSessionLocal",
+        async_sessionmaker(bind=db.bind, expire_on_commit=False),
+    )
+
+async def login(client, username: str, password: str) -> dict:
+    response = await client.post(
+        "/auth/login",
+        data={
+            "username": username,
+            "password": password,
+        },
+    )
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+async def create_posts(client, headers: dict, name: str, count: int) -> tuple[str, list[str]]:
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": name,
+            "description": "Desc",
+        },
+        headers=headers,
+    )
+    category_id = category_response.json()["id"]
+    
+    response = await client.post(
+        "/posts/bulk",
+        json={
+            "items": [
+                {
+                    "title": f"{name} Post {index}",
+                    "content": "Content",
+                    "category_id": category_id,
+                }
+                for index in range(count)
+            ],
+        },
+        headers=headers,
+    )
+    return category_id, [result["item"]["id"] for result in response.json()]
+
+def read_csv(text: str) -> list[list[str]]:
+    return list(csv.reader(io.StringIO(text)))
+
+@pytest.mark.asyncio
+async def test_export_posts_ndjson_excludes_deleted(client):
+    headers = await login(client, "admin@example.com", "admin123")
+    category_id, post_ids = await create_posts(client, headers, "ExportNdjsonCat", 3)
+    await client.delete(f"/posts/{post_ids[1]}", headers=headers)
+    
+    response = await client.get(
+        "/posts/export",
+        params={"category_id": category_id},
+        headers=headers,
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"] == 'attachment; filename="posts.ndjson"'
+    
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    # A bulk batch shares created_at, so rows come back in id order.
+    assert [row["id"] for row in rows] == sorted([post_ids[0], post_ids[2]])
+    assert set(rows[0]) == set(PostRead.model_fields)
+
+
+@pytest.mark.asyncio
+async def test_export_comments_csv_excludes_deleted(client):
+    headers = await login(client, "admin@example.com", "admin123")
+    _, (post_id,) = await create_posts(client, headers, "ExportCsvCat", 1)
+    
+    comment_ids = []
+    for index in range(3):
+        response = await client.post(
+            "/comments/",
+            json={
+                "content": f"Comment, with \"quotes\" {index}",
+                "post_id": post_id,
+            },
+            headers=headers,
+        )
+        comment_ids.append(response.json()["id"])
+    await client.delete(f"/comments/{comment_ids[0]}", headers=headers)
+    
+    response = await client.get(
+        "/comments/export",
+        params={"format": "csv", "post_id": post_id},
+        headers=headers,
+    )
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    
+    rows = read_csv(response.text)
+    assert rows[0] == list(CommentRead.model_fields)
+    assert [row[0] for row in rows[1:]] == comment_ids[1:]
+    assert rows[1][1] == 'Comment, with "quotes" 1'
+
+
+@pytest.mark.asyncio
+async def test_export_users_csv_excludes_deleted(client):
+    headers = await login(client, "admin@example.com", "admin123")
+    
+    user_ids = []
+    for email in ["export-kept@test.com", "export-gone@test.com"]:
+        response = await client.post(
+            "/auth/register",
+            json={
+                "email": email,
+                "password": "password123",
+            },
+        )
+        user_ids.append(response.json()["id"])
+    await client.delete(f"/users/{user_ids[1]}", headers=headers)
+    
+    response = await client.get(
+        "/users/export",
+        params={"format": "csv"},
+        headers=headers,
+    )
+    
+    assert response.status_code == 200
+    rows = read_csv(response.text)
+    assert rows[0] == list(UserRead.model_fields)
+    exported = {row[0] for row in rows[1:]}
+    assert user_ids[0] in exported
+    assert user_ids[1] not in exported
+    assert all(len(row) == len(rows[0]) for row in rows[1:])
+
+
+@pytest.mark.asyncio
+async def test_export_requires_admin(client):
+    await client.post(
+        "/auth/register",
+        json={
+            "email": "export-reader@test.com",
+            "password": "password123",
+        },
+    )
+    headers = await login(client, "export-reader@test.com", "password123")
+    
+    for path in ["/posts/export", "/comments/export", "/users/export"]:
+        response = await client.get(path, headers=headers)
+        assert response.status_code == 403, path
+
+
+@pytest.mark.asyncio
+async def test_export_streams_every_row_across_chunks(client, monkeypatch):
+    monkeypatch.setattr(settings, "export_chunk_size", 2)
+    headers = await login(client, "admin@example.com", "admin123")
+    category_id, post_ids = await create_posts(client, headers, "ExportChunkCat", 5)
+    
+    chunks = [
+        chunk
+        async for chunk in ExportService.stream(
+            ConnectedRequest(),
+            PostRepository.export_query(category_id),
+            PostRead,
+            ExportFormat.NDJSON,
+        )
+    ]
+    assert [chunk.count("\n") for chunk in chunks] == [2, 2, 1]
+    
+    response = await client.get(
+        "/posts/export",
+        params={"category_id": category_id, "format": "csv"},
+        headers=headers,
+    )
+    rows = read_csv(response.text)
+    assert [row[0] for row in rows[1:]] == sorted(post_ids)
@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from app.services.health import health_service
+
+@pytest.mark.asyncio
+async def test_health_live(client):
+    response = await client.get("/health/live")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+
+def stub_probes(monkeypatch, database=None, redis=None):
+    async def ok():
+        return None
+    
+    monkeypatch.setattr(health_service, "_result", None)
+    monkeypatch.setattr(health_service, "ttl", 0)
+    monkeypatch.setattr(health_service, "_check_database", database or ok)
+    monkeypatch.setattr(health_service, "_check_redis", redis or ok)
+
+@pytest.mark.asyncio
+async def test_health_ready_reports_checks(client, monkeypatch):
+    stub_probes(monkeypatch)
+    
+    response = await client.get("/health/ready")
+    assert response.status_code == 200
+    
+    body = response.json()
+    assert body["status"] == "ok"
+    assert set(body["checks"]) == {"database", "redis"}
+    assert body["checks"]["database"]["status"] == "ok"
+    assert "latency_ms" in body["checks"]["database"]
+    assert "checked_out" in body["database_pool"]
+    assert "state" in body["redis_breaker"]
+
+@pytest.mark.asyncio
+async def test_health_ready_reports_probe_timeout(client, monkeypatch):
+    async def hanging():
+        await asyncio.sleep(10)
+    
+    stub_probes(monkeypatch, redis=hanging)
+    monkeypatch.setattr(health_service, "timeout", 0.05)
+    
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    
+    body = response.json()
+    assert body["status"] == "error"
+    assert body["checks"]["database"]["status"] == "ok"
+    assert body["checks"]["redis"]["status"] == "error"
+    assert body["checks"]["redis"]["error"] == "timeout"
+
+@pytest.mark.asyncio
+async def test_health_ready_reports_probe_failure(client, monkeypatch):
+    async def failing():
+        raise ConnectionRefusedError()
+    
+    stub_probes(monkeypatch, database=failing)
+    
+    response = await client.get("/health/ready")
+    assert response.status_code == 503
+    assert response.json()["checks"]["database"]["error"] == "ConnectionRefusedError"
+
+@pytest.mark.asyncio
+async def test_health_checks_are_cached(client, monkeypatch):
+    calls = 0
+    
+    async def fake_run():
+        nonlocal calls
+        calls += 1
+        return {"status": "ok", "checks": {}}
+    
+    monkeypatch.setattr(health_service, "_result", None)
+    monkeypatch.setattr(health_service, "ttl", 60)
+    monkeypatch.setattr(health_service, "_run", fake_run)
+    
+    results = [await health_service.check() for _ in range(3)]
+    
+    assert calls == 1
+    assert all(result["status"] == "ok" for result in results)
@@ -0,0 +1,39 @@
+import pytest
+
+from app.core.metrics import MetricsRegistry
+
+@pytest.mark.asyncio
+async def test_metrics(client):
+    await client.get("/posts/")
+    
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    
+    body = response.text
+    assert 'http_requests_total{method="GET",route="/posts/",status="200"}' in body
+    assert 'http_request_duration_seconds_bucket{method="GET",route="/posts/",le="+Inf"}' in body
+    assert "# TYPE db_query_duration_seconds histogram" in body
+    assert 'db_pool_checked_out{pool="primary"}' in body
+    assert "rate_limit_rejections_total" in body
+
+def test_collector_labels_group_samples():
+    registry = MetricsRegistry()
+    
+    @registry.collector
+    def pools():
+        return [
+            ("db_pool_size", "gauge", "Configured pool size.", 5, {"pool": "primary"}),
+            ("db_pool_size", "gauge", "Configured pool size.", 3, {"pool": "replica-0"}),
+            ("uptime_seconds", "gauge", "Uptime.", 1.5),
+        ]
+    
+    assert registry.render().splitlines() == [
+        "# HELP db_pool_size Configured pool size.",
+        "# TYPE db_pool_size gauge",
+        'db_pool_size{pool="primary"} 5',
+        'db_pool_size{pool="replica-0"} 3',
+        "# HELP uptime_seconds Uptime.",
+        "# TYPE uptime_seconds gauge",
+        "uptime_seconds 1.5",
+    ]
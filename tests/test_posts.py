@@ -31,4 +31,561 @@ async def test_create_post(client):
         headers={"Authorization": f"Bearer {token}"},
     )
     
-    assert response.status_code in (200, 201)
\ No newline at end of file
+    assert response.status_code in (200, 201)
+
+@pytest.mark.asyncio
+async def test_get_posts_with_cursor(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "CursorCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    for i in range(3):
+        await client.post(
+            "/posts/",
+            json={
+                "title": f"Cursor Post {i}",
+                "content": "Content",
+                "category_id": category_id,
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    
+    first_page = await client.get(
+        "/posts/",
+        params={"limit": 2, "category_id": category_id},
+    )
+    assert first_page.status_code == 200
+    first = first_page.json()
+    assert len(first["items"]) == 2
+    assert first["next_cursor"]
+    
+    second_page = await client.get(
+        "/posts/",
+        params={
+            "limit": 2,
+            "category_id": category_id,
+            "cursor": first["next_cursor"],
+        },
+    )
+    assert second_page.status_code == 200
+    second = second_page.json()
+    assert len(second["items"]) == 1
+    assert second["next_cursor"] is None
+    
+    first_ids = {item["id"] for item in first["items"]}
+    assert second["items"][0]["id"] not in first_ids
+    
+    invalid = await client.get("/posts/", params={"cursor": "not-a-cursor"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_posts(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "SearchCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    await client.post(
+        "/posts/",
+        json={
+            "title": "Gardening basics",
+            "content": "Tomatoes need sunlight",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    await client.post(
+        "/posts/",
+        json={
+            "title": "Tomatoes everywhere",
+            "content": "A post about tomatoes",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    response = await client.get(
+        "/posts/",
+        params={"search": "tomatoes", "category_id": category_id},
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert len(items) == 2
+    assert items[0]["title"] == "Tomatoes everywhere"
+
+
+@pytest.mark.asyncio
+async def test_search_posts_with_total_modes(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "SearchTotalCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    for i in range(2):
+        await client.post(
+            "/posts/",
+            json={
+                "title": f"Cucumbers {i}",
+                "content": "Cucumbers need water",
+                "category_id": category_id,
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    
+    for search in ("cucumbers", "cucumbers:water"):
+        for total_mode in ("exact", "estimate", "none"):
+            response = await client.get(
+                "/posts/",
+                params={
+                    "search": search,
+                    "category_id": category_id,
+                    "total": total_mode,
+                },
+            )
+            assert response.status_code == 200
+            page = response.json()
+            assert page["total_mode"] == total_mode
+            
+            if total_mode == "exact" and search == "cucumbers":
+                assert page["total"] == 2
+            elif total_mode == "estimate":
+                assert isinstance(page["total"], int)
+            elif total_mode == "none":
+                assert page["total"] is None
+
+@pytest.mark.asyncio
+async def test_get_posts_total_modes(client):
+    response = await client.get("/posts/", params={"total": "none"})
+    assert response.status_code == 200
+    page = response.json()
+    assert page["total"] is None
+    assert page["total_mode"] == "none"
+    assert "has_more" in page
+    
+    response = await client.get("/posts/", params={"total": "estimate"})
+    assert response.status_code == 200
+    assert isinstance(response.json()["total"], int)
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_posts(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "BulkCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    response = await client.post(
+        "/posts/bulk",
+        json={
+            "items": [
+                {
+                    "title": "Bulk Post 1",
+                    "content": "Content",
+                    "category_id": category_id,
+                },
+                {
+                    "title": "Bulk Post 2",
+                    "content": "Content",
+                    "category_id": "00000000-0000-0000-0000-000000000000",
+                },
+            ],
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    assert response.status_code == 200
+    results = response.json()
+    assert results[0]["status"] == "created"
+    assert results[0]["item"]["title"] == "Bulk Post 1"
+    assert results[1]["status"] == "error"
+
+
+@pytest.mark.asyncio
+async def test_get_posts_with_include(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "IncludeCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    await client.post(
+        "/posts/",
+        json={
+            "title": "Include Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    response = await client.get(
+        "/posts/",
+        params={"category_id": category_id, "include": "author,category"},
+    )
+    assert response.status_code == 200
+    item = response.json()["items"][0]
+    assert item["author"] == {"id": item["author_id"], "display_name": None}
+    assert item["category"]["name"] == "IncludeCat"
+    
+    invalid = await client.get("/posts/", params={"include": "comments"})
+    assert invalid.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_posts_include_author_display_name(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    admin_headers = {"Authorization": f"Bearer {login.json()['access_token']}"}
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "DisplayNameCat",
+            "description": "Desc",
+        },
+        headers=admin_headers,
+    )
+    category_id = category_response.json()["id"]
+    
+    register = await client.post(
+        "/auth/register",
+        json={
+            "email": "named@test.com",
+            "password": "password123",
+            "display_name": "Named Author",
+        },
+    )
+    user_id = register.json()["id"]
+    assert register.json()["display_name"] == "Named Author"
+    
+    user_login = await client.post(
+        "/auth/login",
+        data={
+            "username": "named@test.com",
+            "password": "password123",
+        },
+    )
+    await client.post(
+        "/posts/",
+        json={
+            "title": "Named Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {user_login.json()['access_token']}"},
+    )
+    
+    url = f"/posts/?category_id={category_id}&include=author"
+    response = await client.get(url)
+    author = response.json()["items"][0]["author"]
+    assert author == {"id": user_id, "display_name": "Named Author"}
+    
+    await client.patch(
+        f"/users/{user_id}",
+        json={"display_name": "Renamed Author"},
+        headers=admin_headers,
+    )
+    
+    renamed = await client.get(url, headers={"If-None-Match": response.headers["etag"]})
+    assert renamed.status_code == 200
+    assert renamed.json()["items"][0]["author"]["display_name"] == "Renamed Author"
+
+
+@pytest.mark.asyncio
+async def test_comment_count_and_sort(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "DiscussedCat",
+            "description": "Desc",
+        },
+        headers=headers,
+    )
+    category_id = category_response.json()["id"]
+    
+    quiet = await client.post(
+        "/posts/",
+        json={
+            "title": "Quiet Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers=headers,
+    )
+    discussed = await client.post(
+        "/posts/",
+        json={
+            "title": "Discussed Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers=headers,
+    )
+    discussed_id = discussed.json()["id"]
+    
+    comment_ids = []
+    for i in range(2):
+        comment = await client.post(
+            "/comments/",
+            json={
+                "content": f"Comment {i}",
+                "post_id": discussed_id,
+            },
+            headers=headers,
+        )
+        comment_ids.append(comment.json()["id"])
+    
+    await client.delete(f"/comments/{comment_ids[0]}", headers=headers)
+    
+    response = await client.get(
+        "/posts/",
+        params={"category_id": category_id, "sort": "comments"},
+    )
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert items[0]["id"] == discussed_id
+    assert items[0]["comment_count"] == 1
+    assert items[1]["id"] == quiet.json()["id"]
+    assert items[1]["comment_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_get_post_conditional(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "EtagCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    post_response = await client.post(
+        "/posts/",
+        json={
+            "title": "Etag Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    post_id = post_response.json()["id"]
+    
+    response = await client.get(f"/posts/{post_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    
+    cached = await client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    
+    await client.patch(
+        f"/posts/{post_id}",
+        json={"title": "Etag Post Updated"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    updated = await client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+    assert updated.status_code == 200
+    assert updated.json()["title"] == "Etag Post Updated"
+
+@pytest.mark.asyncio
+async def test_get_posts_etag_tracks_category_rename_and_delete(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "VersionCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    post_response = await client.post(
+        "/posts/",
+        json={
+            "title": "Version Post",
+            "content": "Content",
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    post_id = post_response.json()["id"]
+    
+    url = f"/posts/?category_id={category_id}&include=category"
+    response = await client.get(url)
+    etag = response.headers["etag"]
+    
+    cached = await client.get(url, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    
+    await client.patch(
+        f"/categories/{category_id}",
+        json={"name": "VersionCatRenamed"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    renamed = await client.get(url, headers={"If-None-Match": etag})
+    assert renamed.status_code == 200
+    assert renamed.json()["items"][0]["category"]["name"] == "VersionCatRenamed"
+    etag = renamed.headers["etag"]
+    
+    await client.delete(
+        f"/posts/{post_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    deleted = await client.get(url, headers={"If-None-Match": etag})
+    assert deleted.status_code == 200
+    assert deleted.json()["items"] == []
+
+@pytest.mark.asyncio
+async def test_get_posts_compressed(client):
+    login = await client.post(
+        "/auth/login",
+        data={
+            "username": "admin@example.com",
+            "password": "admin123",
+        },
+    )
+    token = login.json()["access_token"]
+    
+    category_response = await client.post(
+        "/categories/",
+        json={
+            "name": "CompressCat",
+            "description": "Desc",
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    category_id = category_response.json()["id"]
+    
+    await client.post(
+        "/posts/",
+        json={
+            "title": "Large Post",
+            "content": "compressible " * 500,
+            "category_id": category_id,
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    
+    response = await client.get(
+        f"/posts/?category_id={category_id}",
+        headers={"Accept-Encoding": "gzip"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert response.json()["items"][0]["title"] == "Large Post"
+    
+    response = await client.get(
+        f"/posts/?category_id={category_id}",
+        headers={"Accept-Encoding": "identity"},
+    )
+    assert "content-encoding" not in response.headers
@@ -0,0 +1,181 @@
+import asyncio
+import uuid
+
+import pytest
+
+import app.core.principal_cache as principal_cache_module
+from app.core.principal_cache import INVALIDATION_CHANNEL, PrincipalCache
+from app.core.roles import UserRole
+from app.schemas.auth import Principal
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def __getattr__(self, name):
+        def queue(*args):
+            self.commands.append((name, args))
+        return queue
+    
+    async def execute(self):
+        return [await getattr(self.redis, name)(*args) for name, args in self.commands]
+
+class FakePubSub:
+    def __init__(self, messages):
+        self.messages = messages
+    
+    async def subscribe(self, channel):
+        assert channel == INVALIDATION_CHANNEL
+    
+    async def listen(self):
+        for message in self.messages:
+            yield message
+        raise asyncio.CancelledError
+    
+    async def aclose(self):
+        pass
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+        self.published = []
+        self.pubsub_messages = []
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    def pubsub(self):
+        return FakePubSub(self.pubsub_messages)
+    
+    async def get(self, key):
+        return self.values.get(key)
+    
+    async def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1)
+        return int(self.values[key])
+    
+    async def expire(self, key, seconds):
+        return True
+    
+    async def delete(self, key):
+        return int(self.values.pop(key, None) is not None)
+    
+    async def publish(self, channel, message):
+        self.published.append((channel, message))
+    
+    async def set_if_version(self, keys, args):
+        key, version_key = keys
+        version, value, _ = args
+        if self.values.get(version_key, "") != version:
+            return 0
+        self.values[key] = value
+        return 1
+
+def make_principal(**overrides) -> Principal:
+    return Principal(**{
+        "id": uuid.uuid4(),
+        "role": UserRole.USER,
+        "is_active": True,
+        "is_deleted": False,
+        **overrides,
+    })
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(principal_cache_module, "redis_client", redis)
+    monkeypatch.setattr(principal_cache_module, "set_if_version", redis.set_if_version)
+    return redis
+
+def make_loader(*principals):
+    calls = []
+    
+    async def load():
+        calls.append(1)
+        return principals[min(len(calls), len(principals)) - 1]
+    
+    return load, calls
+
+@pytest.mark.asyncio
+async def test_principal_cache_local_and_redis_hits(fake_redis):
+    principal = make_principal()
+    user_id = str(principal.id)
+    cache = PrincipalCache(ttl_seconds=60, local_ttl_seconds=60, max_size=10)
+    load, calls = make_loader(principal)
+    
+    assert await cache.get_or_load(user_id, load) == principal
+    assert await cache.get_or_load(user_id, load) == principal
+    assert len(calls) == 1
+    
+    other_worker = PrincipalCache(ttl_seconds=60, local_ttl_seconds=60, max_size=10)
+    assert await other_worker.get_or_load(user_id, load) == principal
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_principal_cache_local_ttl_expiry(fake_redis, monkeypatch):
+    principal = make_principal()
+    user_id = str(principal.id)
+    cache = PrincipalCache(ttl_seconds=60, local_ttl_seconds=5, max_size=10)
+    load, calls = make_loader(principal)
+    now = 1000.0
+    monkeypatch.setattr(principal_cache_module.time, "monotonic", lambda: now)
+    
+    await cache.get_or_load(user_id, load)
+    assert cache._get_local(user_id) == principal
+    
+    now += 10
+    assert cache._get_local(user_id) is None
+    
+    fake_redis.values.clear()
+    assert await cache.get_or_load(user_id, load) == principal
+    assert len(calls) == 2
+
+@pytest.mark.asyncio
+async def test_principal_cache_invalidation_is_published_and_applied(fake_redis):
+    principal = make_principal()
+    user_id = str(principal.id)
+    cache = PrincipalCache(ttl_seconds=60, local_ttl_seconds=60, max_size=10)
+    load, _ = make_loader(principal)
+    await cache.get_or_load(user_id, load)
+    
+    other_worker = PrincipalCache(ttl_seconds=60, local_ttl_seconds=60, max_size=10)
+    await other_worker.get_or_load(user_id, load)
+    
+    await cache.invalidate(user_id)
+    assert fake_redis.published == [(INVALIDATION_CHANNEL, user_id)]
+    assert cache._get_local(user_id) is None
+    
+    fake_redis.pubsub_messages = [
+        {"type": "subscribe", "data": 1},
+        {"type": "message", "data": user_id},
+    ]
+    with pytest.raises(asyncio.CancelledError):
+        await other_worker.listen()
+    assert other_worker._get_local(user_id) is None
+
+@pytest.mark.asyncio
+async def test_principal_cache_drops_load_overlapping_invalidation(fake_redis):
+    stale = make_principal()
+    fresh = make_principal(id=stale.id, is_active=False)
+    user_id = str(stale.id)
+    cache = PrincipalCache(ttl_seconds=60, local_ttl_seconds=60, max_size=10)
+    
+    async def load_racing_update():
+        await cache.invalidate(user_id)
+        return stale
+    
+    assert await cache.get_or_load(user_id, load_racing_update) == stale
+    assert cache._get_local(user_id) is None
+    assert fake_redis.values.get(f"principal:{user_id}") is None
+    
+    load, calls = make_loader(fresh)
+    assert await cache.get_or_load(user_id, load) == fresh
+    assert await cache.get_or_load(user_id, load) == fresh
+    assert len(calls) == 1
@@ -0,0 +1,21 @@
+from app.core.config import settings
+from app.core.profiler import QueryProfile, statement_shape
+
+def test_statement_shape_collapses_parameters():
+    assert statement_shape(
+        "SELECT * FROM posts\n WHERE id IN ($1, $2, $3) AND is_deleted = $4"
+    ) == "SELECT * FROM posts WHERE id IN (?) AND is_deleted = ?"
+
+def test_profile_flags_n_plus_one():
+    profile = QueryProfile("GET")
+    
+    profile.record("SELECT * FROM posts LIMIT $1", (10,), 0.001)
+    for index in range(settings.n_plus_one_threshold):
+        profile.record("SELECT * FROM users WHERE id = $1", (index,), 0.001)
+    
+    assert profile.count == settings.n_plus_one_threshold + 1
+    assert profile.n_plus_one() == {
+        "SELECT * FROM users WHERE id = ?": settings.n_plus_one_threshold,
+    }
+    assert profile.summary()["duplicate_statements"] == settings.n_plus_one_threshold - 1
+    assert profile.server_timing().startswith("db;dur=")
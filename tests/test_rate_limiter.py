@@ -0,0 +1,293 @@
+import math
+import uuid
+
+import pytest
+import pytest_asyncio
+from fastapi import Response
+from redis.exceptions import ConnectionError
+
+import app.core.rate_limiter as rate_limiter_module
+from app.core.redis import redis_client
+from app.core.rate_limiter import (
+    SCRIPTS,
+    RateLimiter,
+    RateLimitAlgorithm,
+    RateLimitMode,
+    RateLimitResult,
+)
+
+# Captured at import, before the autouse conftest fixture stubs them out.
+REAL_CALL = RateLimiter.__call__
+REAL_CHECK = RateLimiter.check
+
+class FakePipeline:
+    def __init__(self, replies=None, error=None):
+        self.commands = []
+        self.replies = replies
+        self.error = error
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def incrby(self, key, amount):
+        self.commands.append(("incrby", key, amount))
+    
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key, seconds))
+    
+    def get(self, key):
+        self.commands.append(("get", key))
+    
+    async def execute(self):
+        if self.error:
+            raise self.error
+        return self.replies(self.commands)
+
+class FakeRedis:
+    def __init__(self, pipe: FakePipeline):
+        self.pipe = pipe
+    
+    def pipeline(self, transaction=True):
+        return self.pipe
+
+def hybrid_limiter(limit: int = 3) -> RateLimiter:
+    return RateLimiter(
+        limit=limit,
+        window_seconds=60,
+        name="test-hybrid",
+        mode=RateLimitMode.HYBRID,
+    )
+
+def test_hybrid_requires_sliding_window():
+    with pytest.raises(ValueError):
+        RateLimiter(
+            limit=3,
+            window_seconds=60,
+            algorithm=RateLimitAlgorithm.TOKEN_BUCKET,
+            mode=RateLimitMode.HYBRID,
+        )
+
+@pytest.mark.asyncio
+async def test_hybrid_limiter_counts_locally():
+    limiter = hybrid_limiter()
+    
+    results = [limiter._check_local("rate:test-hybrid:ip:1", 1) for _ in range(4)]
+    
+    assert [allowed for allowed, _, _ in results] == [1, 1, 1, 0]
+    assert results[2][1] == 0
+    assert results[3][2] > 0
+    
+    allowed, remaining, _ = limiter._check_local("rate:test-hybrid:ip:2", 1)
+    assert allowed == 1
+    assert remaining == 2
+
+@pytest.mark.asyncio
+async def test_hybrid_sync_flushes_only_pending_keys(monkeypatch):
+    limiter = hybrid_limiter(limit=10)
+    limiter._check_local("rate:test-hybrid:ip:1", 2)
+    limiter._check_local("rate:test-hybrid:ip:2", 1)
+    limiter._windows["rate:test-hybrid:ip:2"].pending = 0
+    limiter._windows["rate:test-hybrid:ip:2"].refreshed_at = float("inf")
+    
+    pipe = FakePipeline(replies=lambda commands: [7, True])
+    monkeypatch.setattr(rate_limiter_module, "redis_client", FakeRedis(pipe))
+    
+    await limiter.sync()
+    
+    assert [command[0] for command in pipe.commands] == ["incrby", "expire"]
+    assert pipe.commands[0][1].startswith("rate:test-hybrid:ip:1:")
+    assert pipe.commands[0][2] == 2
+    
+    counter = limiter._windows["rate:test-hybrid:ip:1"]
+    assert counter.synced == 7
+    assert counter.pending == 0
+    assert limiter.degraded is False
+
+@pytest.mark.asyncio
+async def test_hybrid_sync_failure_keeps_local_counts(monkeypatch):
+    limiter = hybrid_limiter(limit=10)
+    limiter._check_local("rate:test-hybrid:ip:1", 2)
+    
+    pipe = FakePipeline(error=ConnectionError("down"))
+    monkeypatch.setattr(rate_limiter_module, "redis_client", FakeRedis(pipe))
+    
+    await limiter.sync()
+    
+    assert limiter.degraded is True
+    assert limiter._windows["rate:test-hybrid:ip:1"].pending == 2
+    
+    allowed, remaining, _ = limiter._check_local("rate:test-hybrid:ip:1", 1)
+    assert allowed == 1
+    assert remaining == 7
+
+def test_cost_above_limit_is_rejected():
+    from fastapi import HTTPException
+    
+    limiter = RateLimiter(limit=10, window_seconds=60, name="test-cost")
+    limiter.check_cost(10)
+    
+    with pytest.raises(HTTPException) as exc_info:
+        limiter.check_cost(11)
+    assert exc_info.value.status_code == 413
+    assert not exc_info.value.headers
+
+def test_bulk_batches_share_the_create_budget():
+    from app.api.routes.comments import create_comment_limiter
+    from app.api.routes.posts import create_post_limiter
+    from app.schemas.comment import CommentBulkCreate
+    from app.schemas.post import PostBulkCreate
+    
+    for limiter, schema in (
+        (create_post_limiter, PostBulkCreate),
+        (create_comment_limiter, CommentBulkCreate),
+    ):
+        max_items = next(
+            constraint.max_length
+            for constraint in schema.model_fields["items"].metadata
+            if hasattr(constraint, "max_length")
+        )
+        assert limiter.limit == max_items
+
+def test_local_windows_are_pruned(monkeypatch):
+    limiter = hybrid_limiter()
+    now = 1_000_020.0
+    monkeypatch.setattr(rate_limiter_module.time, "time", lambda: now)
+    
+    for i in range(100):
+        limiter._check_local(f"rate:test-hybrid:ip:{i}", 1)
+    assert len(limiter._windows) == 100
+    
+    now += 60
+    limiter._check_local("rate:test-hybrid:ip:0", 1)
+    assert len(limiter._windows) == 100
+    assert limiter._windows["rate:test-hybrid:ip:0"].previous == 1
+    
+    now += 60
+    limiter._check_local("rate:test-hybrid:ip:new", 1)
+    assert list(limiter._windows) == [
+        "rate:test-hybrid:ip:0",
+        "rate:test-hybrid:ip:new",
+    ]
+
+@pytest_asyncio.fixture
+async def script_key():
+    key = f"rate:test-script:{uuid.uuid4()}"
+    yield key
+    keys = [found async for found in redis_client.scan_iter(f"{key}*")]
+    if keys:
+        await redis_client.delete(*keys)
+
+async def redis_now_ms() -> int:
+    seconds, microseconds = await redis_client.time()
+    return seconds * 1000 + microseconds // 1000
+
+@pytest.mark.asyncio
+async def test_sliding_window_script_counts_and_rejects(script_key):
+    script = SCRIPTS[RateLimitAlgorithm.SLIDING_WINDOW]
+    window_ms = 60_000
+    
+    results = [
+        await script(keys=[script_key], args=[3, window_ms, 1])
+        for _ in range(4)
+    ]
+    
+    assert [result[:2] for result in results[:3]] == [[1, 2], [1, 1], [1, 0]]
+    allowed, remaining, retry_after = results[3]
+    assert (allowed, remaining) == (0, 0)
+    assert 0 < retry_after <= window_ms
+
+@pytest.mark.asyncio
+async def test_sliding_window_script_weights_previous_window(script_key):
+    script = SCRIPTS[RateLimitAlgorithm.SLIDING_WINDOW]
+    window_ms = 3_600_000
+    
+    now = await redis_now_ms()
+    current_window = now // window_ms
+    elapsed = now % window_ms
+    await redis_client.set(f"{script_key}:{current_window - 1}", 3)
+    
+    allowed, remaining, retry_after = await script(keys=[script_key], args=[3, window_ms, 1])
+    
+    # Three requests last window weigh 3 * (window - elapsed) / window now.
+    weighted = 3 * (window_ms - elapsed) / window_ms
+    if weighted + 1 <= 3:
+        assert allowed == 1
+        assert remaining == math.floor(3 - weighted - 1)
+    else:
+        assert allowed == 0
+        assert remaining == math.floor(3 - weighted)
+        expected = window_ms - elapsed - 2 * window_ms / 3
+        assert abs(retry_after - expected) < 1000
+
+@pytest.mark.asyncio
+async def test_token_bucket_script_refills_at_rate(script_key):
+    script = SCRIPTS[RateLimitAlgorithm.TOKEN_BUCKET]
+    window_ms = 60_000
+    
+    results = [
+        await script(keys=[script_key], args=[3, window_ms, 1])
+        for _ in range(4)
+    ]
+    
+    assert [result[:2] for result in results[:3]] == [[1, 2], [1, 1], [1, 0]]
+    allowed, remaining, retry_after = results[3]
+    assert (allowed, remaining) == (0, 0)
+    # One token refills every window / capacity milliseconds.
+    assert window_ms / 3 - 1000 < retry_after <= window_ms / 3
+    
+    assert (await script(keys=[script_key], args=[3, window_ms, 5]))[2] == window_ms
+
+def test_global_headers_do_not_override_route_headers():
+    limiter = RateLimiter(limit=100, window_seconds=60, name="test-global")
+    response = Response()
+    response.headers.update({"X-RateLimit-Limit": "5", "X-RateLimit-Remaining": "0"})
+    
+    limiter.apply_default_headers(
+        response,
+        RateLimitResult(limit=100, remaining=94, retry_after=0),
+    )
+    
+    assert response.headers["X-RateLimit-Limit"] == "5"
+    assert response.headers["X-RateLimit-Remaining"] == "0"
+    
+    fresh = Response()
+    limiter.apply_default_headers(
+        fresh,
+        RateLimitResult(limit=100, remaining=94, retry_after=0),
+    )
+    assert fresh.headers["X-RateLimit-Remaining"] == "94"
+
+@pytest.mark.asyncio
+async def test_register_reports_route_limiter_headers(client, monkeypatch):
+    from app.api.routes.auth import register_limiter
+    
+    # The suite stubs limiter calls; restore the real ones for this route.
+    monkeypatch.setattr(RateLimiter, "__call__", REAL_CALL)
+    monkeypatch.setattr(RateLimiter, "check", REAL_CHECK)
+    keys = [key async for key in redis_client.scan_iter(f"rate:{register_limiter.name}:*")]
+    if keys:
+        await redis_client.delete(*keys)
+    
+    responses = [
+        await client.post(
+            "/auth/register",
+            json={
+                "email": f"limited-{index}@test.com",
+                "password": "password123",
+            },
+        )
+        for index in range(register_limiter.limit + 1)
+    ]
+    
+    assert [response.status_code for response in responses[:-1]] == [200] * register_limiter.limit
+    assert responses[0].headers["X-RateLimit-Limit"] == str(register_limiter.limit)
+    assert responses[0].headers["X-RateLimit-Remaining"] == str(register_limiter.limit - 1)
+    
+    rejected = responses[-1]
+    assert rejected.status_code == 429
+    assert rejected.headers["X-RateLimit-Limit"] == str(register_limiter.limit)
+    assert rejected.headers["X-RateLimit-Remaining"] == "0"
+    assert int(rejected.headers["Retry-After"]) > 0
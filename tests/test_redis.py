@@ -0,0 +1,59 @@
+import pytest
+from redis.asyncio.client import Pipeline
+
+from app.core.metrics import redis_command_duration
+from app.core.redis import BreakerState, CircuitBreaker, CircuitOpenError, redis_client
+
+def test_circuit_breaker_opens_and_recovers():
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=0)
+    
+    breaker.record_failure()
+    assert breaker.state == BreakerState.CLOSED
+    
+    breaker.record_failure()
+    assert breaker._state == BreakerState.OPEN
+    assert breaker.state == BreakerState.HALF_OPEN
+    
+    breaker.record_failure()
+    assert breaker._state == BreakerState.OPEN
+    
+    breaker.record_success()
+    assert breaker.state == BreakerState.CLOSED
+    assert breaker.failures == 0
+
+def test_circuit_breaker_short_circuits_while_open():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    assert breaker.status()["short_circuited"] == 1
+
+def test_circuit_breaker_admits_one_half_open_probe():
+    breaker = CircuitBreaker(failure_threshold=1, reset_seconds=60)
+    breaker.record_failure()
+    breaker.opened_at -= 60
+    
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    
+    breaker.record_success()
+    breaker.before_call()
+    breaker.before_call()
+    assert breaker.state == BreakerState.CLOSED
+
+@pytest.mark.asyncio
+async def test_pipeline_execute_records_duration(monkeypatch):
+    async def fake_execute(self, raise_on_error=True):
+        return [1, True]
+    
+    monkeypatch.setattr(Pipeline, "execute", fake_execute)
+    before = redis_command_duration.series.get(("PIPELINE",), {"count": 0})["count"]
+    
+    async with redis_client.pipeline() as pipe:
+        pipe.incr("key")
+        pipe.expire("key", 60)
+        assert await pipe.execute() == [1, True]
+    
+    assert redis_command_duration.series[("PIPELINE",)]["count"] == before + 1
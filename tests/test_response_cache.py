@@ -0,0 +1,136 @@
+import pytest
+
+import app.core.response_cache as response_cache_module
+from app.core.response_cache import ResponseCache, POST_LIST_TAG, category_tag
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self.commands.append((name, args, kwargs))
+        return queue
+    
+    async def execute(self):
+        return [
+            await getattr(self.redis, name)(*args, **kwargs)
+            for name, args, kwargs in self.commands
+        ]
+
+class FakeRedis:
+    def __init__(self):
+        self.hashes = {}
+        self.sets = {}
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+    
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    async def hset(self, key, field=None, value=None, mapping=None):
+        entry = self.hashes.setdefault(key, {})
+        if field is not None:
+            entry[field] = str(value)
+        entry.update({name: str(item) for name, item in (mapping or {}).items()})
+    
+    async def hsetnx(self, key, field, value):
+        entry = self.hashes.setdefault(key, {})
+        if field in entry:
+            return 0
+        entry[field] = str(value)
+        return 1
+    
+    async def hincrby(self, key, field, amount):
+        entry = self.hashes.setdefault(key, {})
+        entry[field] = str(int(entry.get(field, 0)) + amount)
+        return int(entry[field])
+    
+    async def sadd(self, key, *members):
+        self.sets.setdefault(key, set()).update(members)
+    
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+    
+    async def expire(self, key, seconds):
+        return True
+    
+    async def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.sets.pop(key, None)
+
+class BrokenRedis:
+    def pipeline(self, transaction=True):
+        raise ConnectionError("redis is down")
+    
+    async def hgetall(self, key):
+        raise ConnectionError("redis is down")
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = FakeRedis()
+    monkeypatch.setattr(response_cache_module, "redis_client", redis)
+    return redis
+
+@pytest.mark.asyncio
+async def test_response_cache_hit_and_miss(fake_redis):
+    cache = ResponseCache(ttl_seconds=60)
+    key = cache.make_key("posts", limit=10, search=None)
+    
+    assert await cache.get(key) is None
+    
+    await cache.set(key, '{"items": []}', [POST_LIST_TAG], {"etag": 'W/"abc"'})
+    assert await cache.get(key) == ('{"items": []}', {"etag": 'W/"abc"'})
+    assert cache.stats() == {"hits": 1, "misses": 1, "evictions": 0}
+
+def test_response_cache_keys_ignore_unset_params():
+    assert ResponseCache.make_key("posts", limit=10, search=None) == ResponseCache.make_key("posts", limit=10)
+    assert ResponseCache.make_key("posts", limit=10) != ResponseCache.make_key("posts", limit=20)
+
+@pytest.mark.asyncio
+async def test_response_cache_invalidation_evicts_tagged_keys(fake_redis):
+    cache = ResponseCache(ttl_seconds=60)
+    listing = cache.make_key("posts", limit=10)
+    filtered = cache.make_key("posts", limit=10, category_id="c1")
+    await cache.set(listing, "listing", [POST_LIST_TAG])
+    await cache.set(filtered, "filtered", [category_tag("c1")])
+    
+    await cache.invalidate(category_tag("c1"))
+    
+    assert await cache.get(filtered) is None
+    assert await cache.get(listing) is not None
+    assert cache.stats()["evictions"] == 1
+
+@pytest.mark.asyncio
+async def test_response_cache_versions_change_on_invalidation(fake_redis):
+    cache = ResponseCache(ttl_seconds=60)
+    
+    version, modified_at = await cache.versions(POST_LIST_TAG, category_tag("c1"))
+    assert await cache.versions(POST_LIST_TAG, category_tag("c1")) == (version, modified_at)
+    
+    await cache.invalidate(category_tag("c1"))
+    
+    updated, updated_at = await cache.versions(POST_LIST_TAG, category_tag("c1"))
+    assert updated != version
+    assert updated_at >= modified_at
+    assert (await cache.versions(POST_LIST_TAG))[0] == version.split(",")[0]
+
+@pytest.mark.asyncio
+async def test_response_cache_degrades_when_redis_fails(monkeypatch):
+    monkeypatch.setattr(response_cache_module, "redis_client", BrokenRedis())
+    cache = ResponseCache(ttl_seconds=60)
+    
+    assert await cache.get("cache:posts:key") is None
+    assert await cache.versions(POST_LIST_TAG) is None
+    await cache.set("cache:posts:key", "body", [POST_LIST_TAG])
+    await cache.invalidate(POST_LIST_TAG)
+    assert cache.stats() == {"hits": 0, "misses": 1, "evictions": 0}